@@ -22,6 +22,10 @@
         fov: 75,
     };
 
+    // glTF extensions GLTFLoader can decode without extra decoders.
+    // EXT_meshopt_compression (stella --compress meshopt) is not among them.
+    const SUPPORTED_RENDER_EXTENSIONS = ['KHR_mesh_quantization'];
+
     // ============================================================
     // State
     // ============================================================
@@ -242,6 +246,14 @@
             console.log('Level JSON:', levelJson);
         }
         
+        // Reject render GLBs that need glTF extensions this viewer cannot decode
+        const renderExtensions = levelJson?.render?.extensions || [];
+        const unsupported = renderExtensions.filter(ext => !SUPPORTED_RENDER_EXTENSIONS.includes(ext));
+        if (unsupported.length > 0) {
+            throw new Error(`render.glb requires unsupported glTF extensions: ${unsupported.join(', ')}. ` +
+                'Open this world in an external glTF viewer or rebuild it with --compress none.');
+        }
+        
         // Load render.glb
         let renderGlb = null;
         const renderFile = zip.file(`${levelPath}/render.glb`);
@@ -3,6 +3,10 @@ import * as path from 'path';
 import * as fs from 'fs';
 import JSZip from 'jszip';
 
+// glTF extensions the webview's GLTFLoader can decode without extra decoders.
+// EXT_meshopt_compression (stella --compress meshopt) is not among them.
+const SUPPORTED_RENDER_EXTENSIONS = ['KHR_mesh_quantization'];
+
 /**
  * Custom editor provider for .stella files.
  * Opens .stella files in a 3D viewer with WASD controls.
@@ -47,7 +51,15 @@ export class StellaEditorProvider implements vscode.CustomReadonlyEditorProvider
         };
 
         // Load and parse the .stella file
-        const stellaData = await this.loadStellaFile(document.uri);
+        let stellaData: StellaData;
+        try {
+            stellaData = await this.loadStellaFile(document.uri);
+        } catch (error) {
+            const text = error instanceof Error ? error.message : String(error);
+            vscode.window.showErrorMessage(`Stella Viewer: ${text}`);
+            webviewPanel.webview.html = this.getErrorHtml(text);
+            return;
+        }
         
         // Generate webview HTML
         webviewPanel.webview.html = this.getHtmlForWebview(
@@ -97,6 +109,16 @@ export class StellaEditorProvider implements vscode.CustomReadonlyEditorProvider
         const levelJson = await levelFile.async('string');
         const level = JSON.parse(levelJson);
         
+        // Reject render GLBs that need glTF extensions the viewer cannot decode
+        const renderExtensions: string[] = level.render?.extensions || [];
+        const unsupported = renderExtensions.filter(ext => !SUPPORTED_RENDER_EXTENSIONS.includes(ext));
+        if (unsupported.length > 0) {
+            throw new Error(
+                `render GLB requires unsupported glTF extensions: ${unsupported.join(', ')}. ` +
+                'Open this world in an external glTF viewer or rebuild it with --compress none.'
+            );
+        }
+        
         // Read render GLB
         const renderPath = path.dirname(levelPath) + '/' + (level.render?.uri || 'render.glb');
         const renderFile = zip.file(renderPath);
@@ -123,6 +145,24 @@ export class StellaEditorProvider implements vscode.CustomReadonlyEditorProvider
         };
     }
 
+    private getErrorHtml(message: string): string {
+        return `<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta http-equiv="Content-Security-Policy" content="default-src 'none'; style-src 'unsafe-inline';">
+    <title>Stella World Viewer</title>
+    <style>
+        body { font-family: system-ui, sans-serif; padding: 24px; }
+    </style>
+</head>
+<body>
+    <h2>Cannot open this .stella file</h2>
+    <p>${escapeHtml(message)}</p>
+</body>
+</html>`;
+    }
+
     private getHtmlForWebview(webview: vscode.Webview, data: StellaData): string {
         const nonce = getNonce();
         
@@ -514,6 +554,14 @@ interface StellaData {
     collisionBase64: string | null;
 }
 
+function escapeHtml(text: string): string {
+    return text
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;');
+}
+
 function getNonce(): string {
     let text = '';
     const possible = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789';
@@ -20,6 +20,13 @@ setup(
             'open3d>=0.15.0',
             'scipy>=1.7.0',
         ],
+        'fast': [
+            'numba>=0.56.0',
+            'orjson>=3.6.0',
+            'msgspec>=0.18.0',
+            'blake3>=0.3.0',
+            'isal>=1.0.0',
+        ],
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
@@ -11,19 +11,46 @@ Stella World Package - A portable 3D world format for explorable spaces.
 
 __version__ = "0.1.0"
 
-from stella.package import pack_stella, unpack_stella, get_stella_info, validate_stella
-from stella.manifest import make_manifest, make_level_json, Manifest, LevelJson
-from stella.vox_rle import write_rlevox, read_rlevox
+import importlib
+
+# Public name -> defining submodule, imported on first attribute access
+_LAZY_EXPORTS = {
+    "pack_stella": "stella.package",
+    "unpack_stella": "stella.package",
+    "get_stella_info": "stella.package",
+    "validate_stella": "stella.package",
+    "StellaReader": "stella.package",
+    "make_manifest": "stella.manifest",
+    "make_level_json": "stella.manifest",
+    "Manifest": "stella.manifest",
+    "LevelJson": "stella.manifest",
+    "write_rlevox": "stella.vox_rle",
+    "read_rlevox": "stella.vox_rle",
+}
 
 __all__ = [
     "pack_stella",
     "unpack_stella",
     "get_stella_info",
     "validate_stella",
+    "StellaReader",
     "make_manifest",
     "make_level_json",
     "Manifest",
     "LevelJson",
     "write_rlevox",
     "read_rlevox",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'stella' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -30,6 +30,7 @@ def cmd_build_floorplan(args):
             title=args.title or Path(args.input).stem,
             invert=args.invert,
             threshold=args.threshold,
+            compress=args.compress,
         )
         print(f"Success: {result}")
         return 0
@@ -51,6 +52,7 @@ def cmd_build_video(args):
             title=args.title or Path(args.input).stem,
             mast3r_path=args.mast3r_path,
             use_existing_ply=args.use_ply,
+            compress=args.compress,
         )
         print(f"Success: {result}")
         return 0
@@ -165,6 +167,8 @@ def cmd_preview_floorplan(args):
 
 
 def main():
+    from stella.glb import GLB_COMPRESSION
+
     parser = argparse.ArgumentParser(
         description="Stella CLI - Build and manage .stella world files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -192,6 +196,7 @@ Examples:
     fp_parser.add_argument("--title", help="World title")
     fp_parser.add_argument("--invert", action="store_true", help="Invert wall detection (dark = empty)")
     fp_parser.add_argument("--threshold", type=int, default=128, help="Grayscale threshold (default: 128)")
+    fp_parser.add_argument("--compress", choices=list(GLB_COMPRESSION), default="none", help="Render GLB compression (meshopt requires gltfpack)")
     fp_parser.set_defaults(func=cmd_build_floorplan)
     
     # build-video
@@ -206,6 +211,7 @@ Examples:
     vid_parser.add_argument("--title", help="World title")
     vid_parser.add_argument("--mast3r-path", help="Path to MASt3R-SLAM main.py")
     vid_parser.add_argument("--use-ply", help="Skip SLAM and use existing PLY file")
+    vid_parser.add_argument("--compress", choices=list(GLB_COMPRESSION), default="none", help="Render GLB compression (meshopt requires gltfpack)")
     vid_parser.set_defaults(func=cmd_build_video)
     
     # info
@@ -5,7 +5,29 @@ Includes floor plane fitting, mesh generation, and coordinate transforms.
 """
 
 import numpy as np
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Union
+
+from stella.vox_rle import VoxelGrid
+
+try:
+    import numba
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Working precision for coordinates, normals and mesh vertices.
+# float32 gives sub-10um resolution on scans under 100m and halves memory traffic.
+DTYPE = np.float32
+
+# Max number of point-plane distances held in memory at once during RANSAC
+_RANSAC_BATCH_ELEMENTS = 1 << 24
+
+# RANSAC candidates scored between adaptive termination checks
+_RANSAC_CANDIDATE_BATCH = 64
+
+# Stop RANSAC outright once a plane explains this fraction of the points
+_RANSAC_EARLY_STOP_RATIO = 0.95
 
 
 def fit_floor_plane_ransac(
@@ -13,17 +35,31 @@ def fit_floor_plane_ransac(
     n_iterations: int = 1000,
     distance_threshold: float = 0.05,
     min_inlier_ratio: float = 0.1,
+    rng: Optional[np.random.Generator] = None,
+    n_threads: Optional[int] = None,
+    confidence: float = 0.99,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Fit a floor plane using RANSAC.
     
     Assumes floor is roughly horizontal (largest horizontal plane).
     
+    Terminates adaptively: scoring stops once the best plane holds more
+    than 95% of the points, or once enough samples have been drawn to
+    hit an all-inlier triple with the given confidence at the current
+    best inlier ratio.
+    
     Args:
         points: Nx3 array of world coordinates
-        n_iterations: RANSAC iterations
+        n_iterations: Maximum RANSAC iterations
         distance_threshold: Max distance from plane for inlier (meters)
         min_inlier_ratio: Minimum fraction of points as inliers
+        rng: Random generator for sampling (a fresh default_rng if None)
+        n_threads: Cap on threads used to score candidates with the Numba
+            kernel (all cores if None). Lower it when other parallel work
+            (e.g. BLAS) runs concurrently to avoid oversubscription.
+        confidence: Target probability of sampling at least one all-inlier
+            triple, used for adaptive termination
     
     Returns:
         Tuple of:
@@ -34,62 +70,167 @@ def fit_floor_plane_ransac(
     Raises:
         ValueError: If no plane found with enough inliers
     """
-    points = np.asarray(points)
+    points = np.ascontiguousarray(points, dtype=DTYPE)
     n_points = len(points)
     
     if n_points < 3:
         raise ValueError("Need at least 3 points to fit a plane")
     
-    best_inliers = None
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Sample all candidate triples up front and build every plane at once
+    idx = rng.integers(0, n_points, size=(n_iterations, 3), dtype=np.int64)
+    
+    # Resample the (rare) triples that repeat an index
+    repeated = (idx[:, 0] == idx[:, 1]) | (idx[:, 1] == idx[:, 2]) | (idx[:, 0] == idx[:, 2])
+    while repeated.any():
+        idx[repeated] = rng.integers(0, n_points, size=(int(repeated.sum()), 3), dtype=np.int64)
+        repeated = (idx[:, 0] == idx[:, 1]) | (idx[:, 1] == idx[:, 2]) | (idx[:, 0] == idx[:, 2])
+    samples = points[idx]  # (K, 3, 3)
+    
+    v1 = samples[:, 1] - samples[:, 0]
+    v2 = samples[:, 2] - samples[:, 0]
+    normals = np.cross(v1, v2)
+    norms_sq = np.einsum("ij,ij->i", normals, normals)
+    
+    # Drop degenerate (collinear / repeated) samples before taking any sqrt
+    valid = norms_sq >= 1e-20
+    normals = normals[valid] / np.sqrt(norms_sq[valid])[:, None]
+    anchors = samples[valid, 0]
+    sample_index = np.flatnonzero(valid)
+    
+    # Ensure normals point up (positive Y)
+    normals[normals[:, 1] < 0] *= -1
+    
+    # Skip planes that are too tilted (not floor-like)
+    # Floor should be mostly horizontal (normal ~= [0, 1, 0])
+    floor_like = np.abs(normals[:, 1]) >= 0.7
+    normals = normals[floor_like]
+    anchors = anchors[floor_like]
+    sample_index = sample_index[floor_like]
+    
     best_normal = None
     best_point = None
     best_n_inliers = 0
     
-    for _ in range(n_iterations):
-        # Sample 3 random points
-        idx = np.random.choice(n_points, 3, replace=False)
-        p1, p2, p3 = points[idx]
-        
-        # Compute plane normal
-        v1 = p2 - p1
-        v2 = p3 - p1
-        normal = np.cross(v1, v2)
-        norm = np.linalg.norm(normal)
+    if len(normals) > 0:
+        # Plane offsets in float64 to avoid cancellation far from the origin
+        offsets = -np.einsum("ij,ij->i", normals.astype(np.float64), anchors.astype(np.float64))
         
-        if norm < 1e-10:
-            continue  # Degenerate (collinear points)
+        best = 0
+        best_n_inliers = -1
+        for start in range(0, len(normals), _RANSAC_CANDIDATE_BATCH):
+            stop = start + _RANSAC_CANDIDATE_BATCH
+            counts = _count_inliers(
+                points, normals[start:stop], offsets[start:stop], distance_threshold, n_threads
+            )
+            
+            k = int(np.argmax(counts))
+            if counts[k] > best_n_inliers:
+                best = start + k
+                best_n_inliers = int(counts[k])
+            
+            inlier_ratio = best_n_inliers / n_points
+            if inlier_ratio > _RANSAC_EARLY_STOP_RATIO:
+                break
+            
+            # Samples drawn so far, including culled degenerate/tilted ones
+            n_drawn = int(sample_index[min(stop, len(normals)) - 1]) + 1
+            if n_drawn >= _ransac_required_iterations(inlier_ratio, confidence):
+                break
         
-        normal = normal / norm
-        
-        # Ensure normal points up (positive Y)
-        if normal[1] < 0:
-            normal = -normal
-        
-        # Skip if plane is too tilted (not floor-like)
-        # Floor should be mostly horizontal (normal ~= [0, 1, 0])
-        if abs(normal[1]) < 0.7:
-            continue
-        
-        # Compute distances to plane
-        d = -np.dot(normal, p1)
-        distances = np.abs(np.dot(points, normal) + d)
-        
-        # Count inliers
-        inliers = distances < distance_threshold
-        n_inliers = np.sum(inliers)
-        
-        if n_inliers > best_n_inliers:
-            best_n_inliers = n_inliers
-            best_inliers = inliers
-            best_normal = normal
-            best_point = p1
+        best_normal = normals[best]
+        best_point = anchors[best]
+        best_offset = offsets[best]
     
-    if best_n_inliers < min_inlier_ratio * n_points:
+    if best_normal is None or best_n_inliers < min_inlier_ratio * n_points:
         raise ValueError(f"Could not find floor plane with enough inliers ({best_n_inliers}/{n_points})")
     
+    best_inliers = np.abs(points @ best_normal + best_offset) < distance_threshold
+    
     return best_normal, best_point, best_inliers
 
 
+def _ransac_required_iterations(inlier_ratio: float, confidence: float) -> float:
+    """Samples needed to draw an all-inlier triple with the given confidence."""
+    p_good = inlier_ratio ** 3
+    if p_good <= 0.0:
+        return np.inf
+    if p_good >= 1.0:
+        return 1.0
+    return np.log(1.0 - confidence) / np.log(1.0 - p_good)
+
+
+def _count_inliers(
+    points: np.ndarray,
+    normals: np.ndarray,
+    offsets: np.ndarray,
+    threshold: float,
+    n_threads: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Count inliers for each candidate plane.
+    
+    Uses the Numba kernel when available (candidates spread across threads
+    with prange), otherwise scores candidates in batches so the (N x K)
+    distance matrix stays within a fixed budget.
+    
+    Args:
+        points: Nx3 array of points
+        normals: Kx3 array of unit plane normals
+        offsets: K plane offsets (plane: normal . p + offset = 0)
+        threshold: Max distance from plane for inlier
+        n_threads: Max Numba threads (default: Numba's current setting)
+    
+    Returns:
+        Array of K inlier counts
+    """
+    if HAS_NUMBA:
+        previous_threads = numba.get_num_threads()
+        if n_threads is not None:
+            numba.set_num_threads(max(1, min(n_threads, numba.config.NUMBA_NUM_THREADS)))
+        try:
+            return _ransac_count_inliers(
+                np.ascontiguousarray(points),
+                np.ascontiguousarray(normals),
+                np.ascontiguousarray(offsets),
+                float(threshold),
+            )
+        finally:
+            numba.set_num_threads(previous_threads)
+    
+    n_points = len(points)
+    batch = max(1, _RANSAC_BATCH_ELEMENTS // n_points)
+    counts = np.empty(len(normals), dtype=np.int64)
+    for start in range(0, len(normals), batch):
+        stop = start + batch
+        distances = np.abs(points @ normals[start:stop].T + offsets[start:stop])
+        counts[start:stop] = (distances < threshold).sum(axis=0)
+    return counts
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ransac_count_inliers(points, normals, offsets, threshold):
+        """Per-plane inlier counts without materializing the distance matrix."""
+        n_planes = normals.shape[0]
+        n_points = points.shape[0]
+        counts = np.zeros(n_planes, dtype=np.int64)
+        for k in prange(n_planes):
+            nx = normals[k, 0]
+            ny = normals[k, 1]
+            nz = normals[k, 2]
+            d = offsets[k]
+            count = 0
+            for i in range(n_points):
+                dist = nx * points[i, 0] + ny * points[i, 1] + nz * points[i, 2] + d
+                if abs(dist) < threshold:
+                    count += 1
+            counts[k] = count
+        return counts
+
+
 def compute_floor_height(
     points: np.ndarray,
     floor_normal: np.ndarray,
@@ -127,7 +268,7 @@ def align_to_gravity(
     
     Returns:
         Tuple of:
-        - aligned_points: Rotated points
+        - aligned_points: Rotated points (always a new array, safe to modify)
         - rotation_matrix: 3x3 rotation matrix applied
     """
     target = np.array([0.0, 1.0, 0.0])
@@ -138,7 +279,7 @@ def align_to_gravity(
     
     if axis_norm < 1e-10:
         # Already aligned
-        return points.copy(), np.eye(3)
+        return np.array(points, dtype=DTYPE), np.eye(3, dtype=DTYPE)
     
     axis = axis / axis_norm
     angle = np.arccos(np.clip(np.dot(floor_normal, target), -1.0, 1.0))
@@ -146,8 +287,8 @@ def align_to_gravity(
     # Rodrigues' rotation formula
     R = rotation_matrix_from_axis_angle(axis, angle)
     
-    # Rotate points
-    aligned = (R @ points.T).T
+    # Rotate points (row-vector form avoids two transposed copies)
+    aligned = np.asarray(points, dtype=DTYPE) @ R.T
     
     return aligned, R
 
@@ -163,16 +304,31 @@ def rotation_matrix_from_axis_angle(axis: np.ndarray, angle: float) -> np.ndarra
     Returns:
         3x3 rotation matrix
     """
+    x, y, z = axis
+    return _rotation_matrix(float(x), float(y), float(z), float(angle))
+
+
+def _rotation_matrix(x, y, z, angle):
+    """Rodrigues' formula filled element by element (Numba-compiled if available)."""
     c = np.cos(angle)
     s = np.sin(angle)
     t = 1 - c
-    x, y, z = axis
     
-    return np.array([
-        [t*x*x + c,   t*x*y - z*s, t*x*z + y*s],
-        [t*x*y + z*s, t*y*y + c,   t*y*z - x*s],
-        [t*x*z - y*s, t*y*z + x*s, t*z*z + c  ],
-    ])
+    R = np.empty((3, 3), dtype=DTYPE)
+    R[0, 0] = t*x*x + c
+    R[0, 1] = t*x*y - z*s
+    R[0, 2] = t*x*z + y*s
+    R[1, 0] = t*x*y + z*s
+    R[1, 1] = t*y*y + c
+    R[1, 2] = t*y*z - x*s
+    R[2, 0] = t*x*z - y*s
+    R[2, 1] = t*y*z + x*s
+    R[2, 2] = t*z*z + c
+    return R
+
+
+if HAS_NUMBA:
+    _rotation_matrix = njit(cache=True, fastmath=True)(_rotation_matrix)
 
 
 def extrude_2d_to_walls(
@@ -191,18 +347,14 @@ def extrude_2d_to_walls(
         voxel_size: Size of each voxel in meters
     
     Returns:
-        3D boolean array [x, y, z] where y is up
+        New 3D boolean array [x, y, z] where y is up
     """
     dim_x, dim_z = occupancy_2d.shape
     dim_y = int(np.ceil(wall_height / voxel_size))
     
-    grid_3d = np.zeros((dim_x, dim_y, dim_z), dtype=bool)
-    
-    # Extrude walls vertically
-    for y in range(dim_y):
-        grid_3d[:, y, :] = occupancy_2d
-    
-    return grid_3d
+    # Extrude walls vertically in one broadcast copy (writable, C-contiguous)
+    occupancy_2d = np.asarray(occupancy_2d, dtype=bool)
+    return np.ascontiguousarray(np.broadcast_to(occupancy_2d[:, None, :], (dim_x, dim_y, dim_z)))
 
 
 def create_floor_ceiling_grid(
@@ -210,7 +362,8 @@ def create_floor_ceiling_grid(
     floor_thickness: int = 1,
     ceiling_height: int = 27,  # e.g., 2.7m at 0.1m voxels
     ceiling_thickness: int = 1,
-) -> np.ndarray:
+    packed: bool = False,
+) -> Union[np.ndarray, VoxelGrid]:
     """
     Create a voxel grid with floor and ceiling.
     
@@ -219,13 +372,20 @@ def create_floor_ceiling_grid(
         floor_thickness: Floor thickness in voxels
         ceiling_height: Height to ceiling in voxels
         ceiling_thickness: Ceiling thickness in voxels
+        packed: Return a bit-packed VoxelGrid instead of a bool array
     
     Returns:
-        3D boolean grid
+        3D boolean grid (or VoxelGrid if packed)
     """
     dim_x, dim_z = bounds_xz
     dim_y = ceiling_height + ceiling_thickness
     
+    if packed:
+        grid = VoxelGrid.empty((dim_x, dim_y, dim_z))
+        grid.fill_block((0, dim_x), (0, floor_thickness), (0, dim_z))
+        grid.fill_block((0, dim_x), (ceiling_height, ceiling_height + ceiling_thickness), (0, dim_z))
+        return grid
+    
     grid = np.zeros((dim_x, dim_y, dim_z), dtype=bool)
     
     # Floor
@@ -284,6 +444,10 @@ def create_box_mesh(
     return vertices, faces
 
 
+# Unit box template shared by the voxel meshers
+_UNIT_BOX_VERTICES, _UNIT_BOX_FACES = create_box_mesh(np.zeros(3, dtype=DTYPE), np.ones(3, dtype=DTYPE))
+
+
 def voxel_grid_to_mesh(
     grid: np.ndarray,
     voxel_size: float,
@@ -302,30 +466,30 @@ def voxel_grid_to_mesh(
     Returns:
         Tuple of (vertices, faces) for triangle mesh
     """
-    all_vertices = []
-    all_faces = []
-    vertex_offset = 0
-    
-    origin_arr = np.array(origin)
     solid_indices = np.argwhere(grid)
+    n_solid = len(solid_indices)
     
-    for idx in solid_indices:
-        min_corner = origin_arr + idx * voxel_size
-        max_corner = min_corner + voxel_size
-        
-        box_verts, box_faces = create_box_mesh(min_corner, max_corner)
-        
-        all_vertices.append(box_verts)
-        all_faces.append(box_faces + vertex_offset)
-        vertex_offset += len(box_verts)
+    if n_solid == 0:
+        return np.zeros((0, 3), dtype=DTYPE), np.zeros((0, 3), dtype=np.int32)
     
-    if len(all_vertices) == 0:
-        return np.zeros((0, 3)), np.zeros((0, 3), dtype=int)
+    n_box_verts = len(_UNIT_BOX_VERTICES)
+    n_box_faces = len(_UNIT_BOX_FACES)
     
-    vertices = np.vstack(all_vertices)
-    faces = np.vstack(all_faces)
+    # Fill preallocated outputs in place from the broadcast unit box template
+    vertices = np.empty((n_solid, n_box_verts, 3), dtype=DTYPE)
+    np.add(solid_indices[:, None, :], _UNIT_BOX_VERTICES[None, :, :], out=vertices, casting="unsafe")
+    vertices *= DTYPE(voxel_size)
+    vertices += np.array(origin, dtype=DTYPE)
     
-    return vertices, faces
+    faces = np.empty((n_solid, n_box_faces, 3), dtype=np.int32)
+    np.add(
+        _UNIT_BOX_FACES[None, :, :],
+        (np.arange(n_solid, dtype=np.int32) * n_box_verts)[:, None, None],
+        out=faces,
+        casting="unsafe",
+    )
+    
+    return vertices.reshape(-1, 3), faces.reshape(-1, 3)
 
 
 def greedy_mesh_voxels(
@@ -336,7 +500,8 @@ def greedy_mesh_voxels(
     """
     Convert voxel grid to mesh using greedy meshing (more efficient).
     
-    Groups adjacent voxels into larger quads to reduce face count.
+    Only faces between solid and empty voxels are emitted, and co-planar
+    faces are merged into larger quads (2 triangles each).
     
     Args:
         grid: 3D boolean array [x, y, z]
@@ -346,13 +511,139 @@ def greedy_mesh_voxels(
     Returns:
         Tuple of (vertices, faces)
     """
-    # For now, fall back to naive approach
-    # TODO: Implement proper greedy meshing
-    return voxel_grid_to_mesh(grid, voxel_size, origin)
+    grid = np.asarray(grid, dtype=bool)
+    
+    quads = []
+    for d in range(3):
+        u_axis, v_axis = (d + 1) % 3, (d + 2) % 3
+        
+        # Slices along d, with an empty layer on each side
+        g = np.transpose(grid, (d, u_axis, v_axis))
+        padded = np.pad(g, ((1, 1), (0, 0), (0, 0)))
+        
+        for s in range(g.shape[0]):
+            # +d faces lie on plane s+1, -d faces on plane s
+            front = padded[s + 1] & ~padded[s + 2]
+            back = padded[s + 1] & ~padded[s]
+            
+            for plane, sign, mask in ((s + 1, 1, front), (s, -1, back)):
+                for u0, v0, du, dv in greedy_rectangles(mask):
+                    quads.append((d, sign, plane, u0, v0, du, dv))
+    
+    if not quads:
+        return np.zeros((0, 3), dtype=DTYPE), np.zeros((0, 3), dtype=np.int32)
+    
+    quads = np.array(quads, dtype=np.int64)
+    d, sign, plane, u0, v0, du, dv = quads.T
+    n_quads = len(quads)
+    
+    # Quad corners in (d, u, v) index space, counter-clockwise about +d
+    corners_duv = np.zeros((n_quads, 4, 3), dtype=np.int64)
+    corners_duv[:, :, 0] = plane[:, None]
+    corners_duv[:, :, 1] = u0[:, None] + np.stack([0 * du, du, du, 0 * du], axis=1)
+    corners_duv[:, :, 2] = v0[:, None] + np.stack([0 * dv, 0 * dv, dv, dv], axis=1)
+    
+    # Scatter (d, u, v) back to (x, y, z)
+    corners = np.empty_like(corners_duv)
+    rows = np.arange(n_quads)
+    for k in range(3):
+        corners[rows, :, (d + k) % 3] = corners_duv[:, :, k]
+    
+    vertices = corners.reshape(-1, 3).astype(DTYPE) * DTYPE(voxel_size) + np.array(origin, dtype=DTYPE)
+    
+    # int32 faces, like voxel_grid_to_mesh
+    base = (rows.astype(np.int32) * 4)[:, None, None]
+    tris = np.where(
+        (sign > 0)[:, None, None],
+        np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32),
+        np.array([[0, 2, 1], [0, 3, 2]], dtype=np.int32),
+    )
+    faces = (tris + base).reshape(-1, 3)
+    
+    return vertices, faces
+
+
+def greedy_rectangles(mask: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """
+    Cover a 2D boolean mask with maximal greedy rectangles.
+    
+    Scans rows in order; each rectangle is grown along v first, then
+    along u while the whole span stays set.
+    
+    Args:
+        mask: 2D boolean array [u, v]
+    
+    Returns:
+        List of (u0, v0, du, dv) rectangles
+    """
+    if not mask.any():
+        return []
+    
+    if HAS_NUMBA:
+        rects = _greedy_rectangles_kernel(np.ascontiguousarray(mask, dtype=np.bool_))
+        return list(map(tuple, rects.tolist()))
+    
+    mask = mask.copy()
+    dim_u = mask.shape[0]
+    rects = []
+    
+    for u in range(dim_u):
+        row = mask[u]
+        while True:
+            set_cols = np.flatnonzero(row)
+            if len(set_cols) == 0:
+                break
+            v0 = int(set_cols[0])
+            
+            # Width: length of the run starting at v0
+            rest = row[v0:]
+            dv = int(rest.argmin()) if not rest.all() else len(rest)
+            
+            # Height: extend while the next row covers the whole span
+            du = 1
+            while u + du < dim_u and mask[u + du, v0:v0 + dv].all():
+                du += 1
+            
+            mask[u:u + du, v0:v0 + dv] = False
+            rects.append((u, v0, du, dv))
+    
+    return rects
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _greedy_rectangles_kernel(mask):
+        """Same scan as greedy_rectangles, as one compiled pass over the mask."""
+        mask = mask.copy()
+        dim_u, dim_v = mask.shape
+        rects = np.empty((mask.sum(), 4), dtype=np.int64)
+        n_rects = 0
+        for u in range(dim_u):
+            v0 = 0
+            while v0 < dim_v:
+                if not mask[u, v0]:
+                    v0 += 1
+                    continue
+                
+                # Width: length of the run starting at v0
+                dv = 1
+                while v0 + dv < dim_v and mask[u, v0 + dv]:
+                    dv += 1
+                
+                # Height: extend while the next row covers the whole span
+                du = 1
+                while u + du < dim_u and mask[u + du, v0:v0 + dv].all():
+                    du += 1
+                
+                mask[u:u + du, v0:v0 + dv] = False
+                rects[n_rects] = (u, v0, du, dv)
+                n_rects += 1
+                v0 += dv
+        return rects[:n_rects]
 
 
 def compute_spawn_position(
-    grid: np.ndarray,
+    grid: Union[np.ndarray, VoxelGrid],
     voxel_size: float,
     origin: Tuple[float, float, float],
     player_height: float = 1.7,
@@ -361,10 +652,12 @@ def compute_spawn_position(
     """
     Find a valid spawn position in the world.
     
-    Searches for an empty space that can fit the player.
+    Searches for an empty space that can fit the player. The clearance
+    test runs on the bit-packed grid: a sliding-window OR along each axis
+    marks every player-sized box that contains a solid voxel.
     
     Args:
-        grid: 3D boolean voxel grid
+        grid: 3D boolean voxel grid (dense or VoxelGrid)
         voxel_size: Size of each voxel
         origin: World origin
         player_height: Player height in meters
@@ -373,43 +666,153 @@ def compute_spawn_position(
     Returns:
         [x, y, z] spawn position or None if no valid position found
     """
-    dim_x, dim_y, dim_z = grid.shape
+    packed = grid if isinstance(grid, VoxelGrid) else VoxelGrid.from_dense(grid)
+    dim_x, dim_y, dim_z = packed.shape
     origin_arr = np.array(origin)
     
     player_height_voxels = int(np.ceil(player_height / voxel_size))
     player_radius_voxels = int(np.ceil(player_radius / voxel_size))
     
-    # Search for empty column
-    for x in range(player_radius_voxels, dim_x - player_radius_voxels):
-        for z in range(player_radius_voxels, dim_z - player_radius_voxels):
-            # Find lowest empty y with enough headroom
-            for y in range(dim_y - player_height_voxels):
-                # Check if space is clear
-                region = grid[
-                    x - player_radius_voxels:x + player_radius_voxels + 1,
-                    y:y + player_height_voxels,
-                    z - player_radius_voxels:z + player_radius_voxels + 1
-                ]
-                
-                if not region.any():
-                    # Found clear space, check if standing on ground
-                    if y == 0 or grid[x, y - 1, z]:
-                        world_pos = origin_arr + np.array([x + 0.5, y, z + 0.5]) * voxel_size
-                        return world_pos.tolist()
+    r = player_radius_voxels
+    h = player_height_voxels
+    width = 2 * r + 1
+    
+    n_x = dim_x - 2 * r
+    n_y = dim_y - h
+    n_z = dim_z - 2 * r
+    if n_x <= 0 or n_y <= 0 or n_z <= 0:
+        return None
+    
+    # Packed occupancy of the player box starting at each (x - r, y, z - r)
+    occupied = _window_or_bits(packed.data, width)
+    occupied = _window_or(occupied, h, axis=1)[:, :n_y]
+    occupied = _window_or(occupied, width, axis=0)
+    
+    # Unpack in x blocks so the scan can stop at the first hit
+    block = max(1, _SPAWN_BLOCK_VOXELS // max(1, n_y * dim_z))
+    for bx in range(0, n_x, block):
+        ex = min(bx + block, n_x)
+        clear = ~np.unpackbits(occupied[bx:ex], axis=-1, count=dim_z)[:, :, :n_z].view(bool)
+        
+        # Standing on ground: y == 0 or solid voxel directly below the column
+        below = np.unpackbits(packed.data[bx + r:ex + r, :n_y - 1], axis=-1, count=dim_z)
+        grounded = np.ones_like(clear)
+        grounded[:, 1:, :] = below[:, :, r:r + n_z].view(bool)
+        
+        # Search order matches a scan over x, then z, then lowest y
+        candidates = np.argwhere((clear & grounded).transpose(0, 2, 1))
+        if len(candidates) > 0:
+            x0, z0, y = candidates[0]
+            world_pos = origin_arr + np.array([bx + x0 + r + 0.5, y, z0 + r + 0.5]) * voxel_size
+            return world_pos.tolist()
     
     return None
 
 
+# Max unpacked voxels materialized per block during the spawn scan
+_SPAWN_BLOCK_VOXELS = 1 << 22
+
+
+def _window_or(a: np.ndarray, window: int, axis: int) -> np.ndarray:
+    """
+    Sliding-window OR along an axis (output length n - window + 1).
+    
+    Builds power-of-two windows by doubling, then covers the requested
+    window with two overlapping power-of-two windows.
+    """
+    a = np.moveaxis(a, axis, 0)
+    span = 1
+    acc = a
+    while span * 2 <= window:
+        acc = acc[:-span] | acc[span:]
+        span *= 2
+    out = acc[:len(a) - window + 1] | acc[window - span:window - span + len(a) - window + 1]
+    return np.moveaxis(out, 0, axis)
+
+
+def _shift_bits(packed: np.ndarray, k: int) -> np.ndarray:
+    """
+    Shift bits packed along the last axis so bit z takes the value of bit z + k.
+    
+    Bits shifted in past the end are zero. Uses np.packbits' MSB-first order.
+    """
+    q, s = divmod(k, 8)
+    shifted = np.zeros_like(packed)
+    n = packed.shape[-1]
+    if q >= n:
+        return shifted
+    src = packed[..., q:]
+    if s == 0:
+        shifted[..., :n - q] = src
+    else:
+        shifted[..., :n - q] = src << s
+        shifted[..., :n - q - 1] |= src[..., 1:] >> (8 - s)
+    return shifted
+
+
+def _window_or_bits(packed: np.ndarray, window: int) -> np.ndarray:
+    """Sliding-window OR over bits packed along the last axis (same width)."""
+    span = 1
+    acc = packed
+    while span * 2 <= window:
+        acc = acc | _shift_bits(acc, span)
+        span *= 2
+    if span < window:
+        acc = acc | _shift_bits(acc, window - span)
+    return acc
+
+
 def calculate_distance(point_a: np.ndarray, point_b: np.ndarray) -> float:
     """Calculate Euclidean distance between two points."""
     return float(np.linalg.norm(np.array(point_a) - np.array(point_b)))
 
 
+def calculate_distance_sq(point_a: np.ndarray, point_b: np.ndarray) -> float:
+    """Calculate squared Euclidean distance (no sqrt; compare against radius**2)."""
+    diff = np.asarray(point_a, dtype=float) - np.asarray(point_b, dtype=float)
+    return float(np.dot(diff, diff))
+
+
 def calculate_centroid(points: np.ndarray) -> np.ndarray:
     """Calculate the centroid of a set of points."""
     return np.mean(points, axis=0)
 
 
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    Determine which points are inside a polygon using ray-casting.
+    
+    Evaluates every (point, edge) crossing test at once.
+    
+    Args:
+        points: Nx2 array of (x, y) points to test
+        polygon: Mx2 array of (x, y) vertices
+    
+    Returns:
+        Boolean array of length N, True where the point is inside
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 2)
+    poly = np.asarray(polygon, dtype=float).reshape(-1, 2)
+    
+    x = pts[:, 0:1]
+    y = pts[:, 1:2]
+    
+    # Edges (p1 -> p2), closing back to the first vertex
+    p1x, p1y = poly[:, 0], poly[:, 1]
+    p2 = np.roll(poly, -1, axis=0)
+    p2x, p2y = p2[:, 0], p2[:, 1]
+    
+    # Edge straddles the horizontal ray through y
+    straddles = (y > np.minimum(p1y, p2y)) & (y <= np.maximum(p1y, p2y))
+    
+    # Straddling edges are never horizontal, so the division is safe there
+    dy = np.where(p1y != p2y, p2y - p1y, 1.0)
+    xinters = (y - p1y) * (p2x - p1x) / dy + p1x
+    
+    crossings = straddles & (x <= xinters)
+    return np.logical_xor.reduce(crossings, axis=1)
+
+
 def is_point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
     """
     Determine if a point is inside a polygon using ray-casting.
@@ -421,27 +824,24 @@ def is_point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, f
     Returns:
         True if point is inside polygon
     """
-    x, y = point
-    inside = False
-    n = len(polygon)
+    return bool(points_in_polygon(np.array([point]), polygon)[0])
+
+
+def transform_points(points: np.ndarray, transformation_matrix: np.ndarray) -> np.ndarray:
+    """
+    Transform a batch of points using a 4x4 transformation matrix.
     
-    p1x, p1y = polygon[0]
-    for i in range(n + 1):
-        p2x, p2y = polygon[i % n]
-        if y > min(p1y, p2y):
-            if y <= max(p1y, p2y):
-                if x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-        p1x, p1y = p2x, p2y
+    Args:
+        points: Nx3 array of points
+        transformation_matrix: 4x4 homogeneous transform
     
-    return inside
+    Returns:
+        Nx3 array of transformed points
+    """
+    T = np.asarray(transformation_matrix)
+    return np.asarray(points) @ T[:3, :3].T + T[:3, 3]
 
 
 def transform_point(point: np.ndarray, transformation_matrix: np.ndarray) -> np.ndarray:
     """Transform a point using a 4x4 transformation matrix."""
-    point_homogeneous = np.append(point, 1)
-    transformed_point = transformation_matrix @ point_homogeneous
-    return transformed_point[:3]
+    return transform_points(np.asarray(point)[None], transformation_matrix)[0]
@@ -0,0 +1,69 @@
+"""
+Post-processing for level render GLBs.
+
+Optionally routes a GLB through gltfpack to apply meshopt compression
+(EXT_meshopt_compression) and vertex quantization (KHR_mesh_quantization).
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+# Supported values for the `compress` option of the build pipelines
+GLB_COMPRESSION = ("none", "meshopt")
+
+# glTF extensions a viewer must support to load a gltfpack -cc output
+MESHOPT_EXTENSIONS = ["EXT_meshopt_compression", "KHR_mesh_quantization"]
+
+
+def compress_glb(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    method: str = "meshopt",
+    gltfpack: Optional[str] = None,
+) -> Tuple[Path, List[str]]:
+    """
+    Compress a GLB file.
+
+    With method "none" nothing is written: the input GLB is returned as is.
+
+    Args:
+        input_path: Source GLB
+        output_path: Destination GLB for gltfpack (may not equal input_path)
+        method: One of GLB_COMPRESSION
+        gltfpack: Path to the gltfpack binary (looked up on PATH if None)
+
+    Returns:
+        Tuple of (path of the GLB to package, glTF extensions it requires)
+
+    Raises:
+        ValueError: If method is unknown
+        FileNotFoundError: If gltfpack is required but not found
+        RuntimeError: If gltfpack fails
+    """
+    if method not in GLB_COMPRESSION:
+        raise ValueError(f"Unknown GLB compression: {method}, expected one of {GLB_COMPRESSION}")
+
+    input_path = Path(input_path)
+    output_path = Path(output_path)
+
+    if method == "none":
+        return input_path, []
+
+    gltfpack = gltfpack or shutil.which("gltfpack")
+    if gltfpack is None:
+        raise FileNotFoundError(
+            "gltfpack is required for meshopt compression. "
+            "Install with: npm install -g gltfpack"
+        )
+
+    cmd = [gltfpack, "-cc", "-i", str(input_path), "-o", str(output_path)]
+
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"gltfpack failed with exit code {e.returncode}: {stderr}")
+
+    return output_path, list(MESHOPT_EXTENSIONS)
@@ -5,45 +5,155 @@ This module provides dataclasses and helpers for creating and validating
 the manifest.json and level.json files required in .stella packages.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Union
 import json
-from datetime import datetime, timezone
+import re
+import sys
+import time
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+# Anything json_loads parses without a str round-trip (plus str itself)
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+# Slotted instances (no per-object __dict__) where dataclass supports it
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(obj: Any, indent: int = 2) -> str:
+    """
+    Serialize to a JSON string, using orjson or msgspec when available.
+    
+    orjson only supports 2-space indentation; other indents fall back to
+    msgspec or stdlib json.
+    """
+    return json_dumps_bytes(obj, indent=indent).decode("utf-8")
+
+
+def json_dumps_bytes(obj: Any, indent: int = 2) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes (no str round-trip with orjson).
+    
+    NumPy scalars and arrays (e.g. a spawn position built from array math)
+    are accepted by every backend.
+    """
+    if HAS_ORJSON and indent == 2:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=_json_default,
+        )
+    if HAS_MSGSPEC:
+        return msgspec.json.format(msgspec.json.encode(obj, enc_hook=_json_default), indent=indent)
+    return json.dumps(obj, indent=indent, default=_json_default).encode("utf-8")
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy scalars and arrays to Python values for JSON encoders."""
+    if type(obj).__module__ == "numpy" and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_loads(data: JsonInput) -> Any:
+    """
+    Parse JSON from str or a UTF-8 buffer, using orjson or msgspec when available.
+    
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON, on every backend
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if HAS_MSGSPEC:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise _msgspec_decode_error(e, data) from e
+    if isinstance(data, memoryview):
+        data = data.tobytes()  # json.loads takes str, bytes or bytearray only
+    return json.loads(data)
+
+
+def _msgspec_decode_error(error: Exception, data: JsonInput) -> json.JSONDecodeError:
+    """Convert a msgspec DecodeError to json.JSONDecodeError (orjson's error already is one)."""
+    raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+    # msgspec reports a byte offset, e.g. "JSON is malformed: invalid character (byte 7)"
+    match = re.search(r" \(byte (\d+)\)$", str(error))
+    msg = str(error)[:match.start()] if match else str(error)
+    offset = int(match.group(1)) if match else len(raw)
+    doc = raw.decode("utf-8", errors="replace")
+    return json.JSONDecodeError(msg, doc, len(raw[:offset].decode("utf-8", errors="replace")))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Axis:
     """Coordinate system definition."""
     up: str = "Y"
     forward: str = "-Z"
     handedness: str = "right"
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"up": self.up, "forward": self.forward, "handedness": self.handedness}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Generator:
     """Build tool information."""
     name: str = "stella-cli"
     version: str = "0.1.0"
     git_commit: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = {"name": self.name, "version": self.version}
+        if self.git_commit is not None:
+            d["git_commit"] = self.git_commit
+        return d
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class World:
     """World-level metadata."""
     title: str = "Untitled World"
     tags: List[str] = field(default_factory=list)
     privacy: Dict[str, Any] = field(default_factory=lambda: {"contains_source_media": False})
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "tags": list(self.tags), "privacy": dict(self.privacy)}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Level:
     """Reference to a level within the package."""
     id: str
     path: str
     name: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = {"id": self.id, "path": self.path}
+        if self.name is not None:
+            d["name"] = self.name
+        return d
+
 
-@dataclass
+def _now_iso() -> str:
+    """Current UTC time as ISO 8601 with microseconds, without building a datetime."""
+    seconds, ns = divmod(time.time_ns(), 1_000_000_000)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{stamp}.{ns // 1000:06d}+00:00"
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Manifest:
     """
     Main manifest.json structure for .stella files.
@@ -58,7 +168,7 @@ class Manifest:
     """
     format: str = "stella.world"
     version: int = 1
-    created_utc: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_utc: str = field(default_factory=_now_iso)
     units: str = "meters"
     axis: Axis = field(default_factory=Axis)
     levels: List[Level] = field(default_factory=list)
@@ -73,24 +183,24 @@ class Manifest:
             "version": self.version,
             "created_utc": self.created_utc,
             "units": self.units,
-            "axis": asdict(self.axis),
-            "levels": [
-                {k: v for k, v in asdict(lvl).items() if v is not None}
-                for lvl in self.levels
-            ],
+            "axis": self.axis.to_dict(),
+            "levels": [lvl.to_dict() for lvl in self.levels],
         }
         if self.generator:
-            gen = asdict(self.generator)
-            d["generator"] = {k: v for k, v in gen.items() if v is not None}
+            d["generator"] = self.generator.to_dict()
         if self.world:
-            d["world"] = asdict(self.world)
+            d["world"] = self.world.to_dict()
         if self.assets:
             d["assets"] = self.assets
         return d
 
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return json_dumps(self.to_dict(), indent=indent)
+
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return json_dumps_bytes(self.to_dict(), indent=indent)
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "Manifest":
@@ -109,7 +219,7 @@ class Manifest:
         return cls(
             format=d.get("format", "stella.world"),
             version=d.get("version", 1),
-            created_utc=d.get("created_utc", datetime.now(timezone.utc).isoformat()),
+            created_utc=d["created_utc"] if "created_utc" in d else _now_iso(),
             units=d.get("units", "meters"),
             axis=axis,
             levels=levels,
@@ -119,9 +229,9 @@ class Manifest:
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "Manifest":
-        """Create Manifest from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str: JsonInput) -> "Manifest":
+        """Create Manifest from JSON string or UTF-8 bytes (bytes, bytearray, memoryview)."""
+        return cls.from_dict(json_loads(json_str))
 
     def validate(self) -> List[str]:
         """
@@ -156,52 +266,86 @@ class Manifest:
         return errors
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PlayerCollision:
     """Player collision capsule parameters."""
     height_m: float = 1.7
     radius_m: float = 0.3
     step_height_m: float = 0.35
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "height_m": self.height_m,
+            "radius_m": self.radius_m,
+            "step_height_m": self.step_height_m,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Spawn:
     """Spawn point definition."""
     position: List[float] = field(default_factory=lambda: [0.0, 1.7, 0.0])
     yaw_degrees: float = 0.0
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"position": list(self.position), "yaw_degrees": self.yaw_degrees}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RenderAsset:
     """Render asset reference."""
     type: str = "glb"
     uri: str = "render.glb"
+    extensions: Optional[List[str]] = None  # glTF extensions required to load the asset
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = {"type": self.type, "uri": self.uri}
+        if self.extensions is not None:
+            d["extensions"] = list(self.extensions)
+        return d
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CollisionAsset:
     """Collision asset reference."""
     type: str = "rlevox"
     uri: str = "collision.rlevox"
     player: PlayerCollision = field(default_factory=PlayerCollision)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.type, "uri": self.uri, "player": self.player.to_dict()}
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NavigationAsset:
     """Navigation asset reference."""
     type: str = "none"
     uri: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = {"type": self.type}
+        if self.uri is not None:
+            d["uri"] = self.uri
+        return d
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CaptureInfo:
     """Source capture metadata."""
     source: str = "unknown"
     source_fps: Optional[int] = None
     notes: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        d = {"source": self.source}
+        if self.source_fps is not None:
+            d["source_fps"] = self.source_fps
+        if self.notes is not None:
+            d["notes"] = self.notes
+        return d
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LevelJson:
     """
     Level definition (levels/<n>/level.json).
@@ -219,27 +363,26 @@ class LevelJson:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        collision_dict = asdict(self.collision)
-        nav_dict = asdict(self.navigation)
-        nav_dict = {k: v for k, v in nav_dict.items() if v is not None}
-        
         d = {
             "level_version": self.level_version,
             "name": self.name,
             "scale": self.scale,
-            "spawn": asdict(self.spawn),
-            "render": asdict(self.render),
-            "collision": collision_dict,
-            "navigation": nav_dict,
+            "spawn": self.spawn.to_dict(),
+            "render": self.render.to_dict(),
+            "collision": self.collision.to_dict(),
+            "navigation": self.navigation.to_dict(),
         }
         if self.capture:
-            capture_dict = asdict(self.capture)
-            d["capture"] = {k: v for k, v in capture_dict.items() if v is not None}
+            d["capture"] = self.capture.to_dict()
         return d
 
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return json_dumps(self.to_dict(), indent=indent)
+
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return json_dumps_bytes(self.to_dict(), indent=indent)
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "LevelJson":
@@ -274,9 +417,9 @@ class LevelJson:
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "LevelJson":
-        """Create LevelJson from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str: JsonInput) -> "LevelJson":
+        """Create LevelJson from JSON string or UTF-8 bytes (bytes, bytearray, memoryview)."""
+        return cls.from_dict(json_loads(json_str))
 
 
 def make_manifest(
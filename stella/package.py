@@ -4,36 +4,187 @@ Pack and unpack .stella files (ZIP containers).
 .stella files are ZIP archives with deterministic ordering and optional checksums.
 """
 
+import contextlib
+import copy
+import os
+import re
+import shutil
+import struct
+import threading
+import time
 import zipfile
 import hashlib
 import json
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Union, Tuple, Optional, List
+from operator import itemgetter
+from typing import BinaryIO, Callable, Dict, Iterable, Union, Tuple, Optional, List
 from io import BytesIO
 
-from stella.manifest import Manifest, LevelJson
+from stella.manifest import Manifest, LevelJson, json_dumps_bytes
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+try:
+    from isal import isal_zlib
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+# Supported checksum algorithms; the checksum entry is named after the
+# algorithm (checksums.sha256, checksums.blake3)
+CHECKSUM_ALGORITHMS = ("sha256", "blake3")
+
+# Entries that are already entropy-coded; deflating them again costs CPU
+# for almost no size gain, so they are stored as-is.
+STORED_SUFFIXES = frozenset({
+    ".png", ".jpg", ".jpeg", ".webp", ".ktx2", ".basis",
+    ".mp4", ".zip", ".gz", ".zst",
+})
+
+# Small, highly redundant metadata entries; maximum deflate level is
+# nearly free for them
+MAX_LEVEL_SUFFIXES = frozenset({".json", ".sha256", ".blake3"})
+
+# An archive entry's contents: in-memory bytes, a file on disk, or a
+# callable returning a fresh binary stream
+FileSource = Union[bytes, Path, Callable[[], BinaryIO]]
+
+# SHA-256 of empty input
+EMPTY_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+# Chunk size for streaming file sources into the archive
+COPY_CHUNK_SIZE = 1 << 20
+
+# ZIP local file header; the last two fields are the name and extra lengths
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+
+# One checksums-file line: "<hex digest>  <path>" (groups 1, 2), or any
+# other non-blank line (group 3, malformed)
+_CHECKSUM_LINE = re.compile(rb"^([0-9a-fA-F]+)  (.+?)\r?$|^(.*\S.*?)\r?$", re.MULTILINE)
 
 
 def compute_sha256(data: bytes) -> str:
     """Compute SHA256 hash of bytes."""
+    if not data:
+        return EMPTY_SHA256
     return hashlib.sha256(data).hexdigest()
 
 
+def _new_hash(algorithm: str = "sha256"):
+    """
+    Create a hash object for a checksum algorithm.
+    
+    Raises:
+        ValueError: If algorithm is unknown
+        ImportError: If blake3 is requested but not installed
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake3":
+        if not HAS_BLAKE3:
+            raise ImportError("blake3 checksums require blake3. Install with: pip install blake3")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    raise ValueError(f"Unknown checksum algorithm: {algorithm}, expected one of {CHECKSUM_ALGORITHMS}")
+
+
+@lru_cache(maxsize=None)
+def _empty_digest(algorithm: str) -> str:
+    """Hex digest of empty input (computed once per algorithm)."""
+    return _new_hash(algorithm).hexdigest()
+
+
+def compute_checksum(data: bytes, algorithm: str = "sha256") -> str:
+    """Compute the hex digest of bytes with a checksum algorithm."""
+    if not data:
+        return _empty_digest(algorithm)
+    h = _new_hash(algorithm)
+    h.update(data)
+    return h.hexdigest()
+
+
+def _digest_stream(fh: BinaryIO, algorithm: str = "sha256") -> str:
+    """Hash a binary stream in chunks, without reading it into one bytes object."""
+    if algorithm == "sha256" and hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+    h = _new_hash(algorithm)
+    for chunk in iter(lambda: fh.read(COPY_CHUNK_SIZE), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def _compression_for(path: str) -> Tuple[int, Optional[int]]:
+    """Pick the ZIP compression method and level for an archive entry."""
+    suffix = Path(path).suffix.lower()
+    if suffix in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED, None
+    if suffix in MAX_LEVEL_SUFFIXES:
+        return zipfile.ZIP_DEFLATED, 9
+    return zipfile.ZIP_DEFLATED, None
+
+
+def _zip_info(path: str) -> zipfile.ZipInfo:
+    """Build the ZipInfo for an archive entry (same metadata as writestr)."""
+    zinfo = zipfile.ZipInfo(path, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type, level = _compression_for(path)
+    zinfo._compresslevel = level  # honoured by both writestr and open("w")
+    zinfo.external_attr = 0o600 << 16
+    return zinfo
+
+
+def _open_source(source: FileSource) -> BinaryIO:
+    """Open a non-bytes file source for reading."""
+    if isinstance(source, Path):
+        return source.open("rb")
+    return source()
+
+
+class _HashingWriter:
+    """File-like proxy that hashes bytes on their way to dst."""
+    
+    def __init__(self, dst: BinaryIO, algorithm: str = "sha256"):
+        self.dst = dst
+        self.h = _new_hash(algorithm)
+    
+    def write(self, b: bytes) -> int:
+        self.h.update(b)
+        return self.dst.write(b)
+
+
 def pack_stella(
     output_path: Union[str, Path],
     manifest: Union[Manifest, Dict],
-    file_map: Dict[str, bytes],
+    file_map: Union[Dict[str, FileSource], Iterable[Tuple[str, FileSource]]],
     include_checksums: bool = True,
+    checksum_algorithm: str = "sha256",
 ) -> Path:
     """
     Pack a .stella file from manifest and file contents.
     
+    Entries with an already-compressed suffix (see STORED_SUFFIXES) are
+    stored; everything else, including GLB and RLEVOX, is deflated, with
+    JSON and checksum entries at maximum level.
+    Path and callable sources are streamed into the archive in
+    COPY_CHUNK_SIZE chunks instead of being loaded into memory.
+    
     Args:
         output_path: Path for output .stella file
         manifest: Manifest object or dict
-        file_map: Dict mapping archive paths to file bytes
-                  e.g. {"levels/0/render.glb": <bytes>, ...}
-        include_checksums: Whether to include checksums.sha256
+        file_map: Archive paths mapped to file bytes, a Path to read from,
+                  or a callable returning a binary stream; either a dict
+                  or an iterable of (path, source) pairs, where a later
+                  pair overrides an earlier one with the same path
+                  e.g. {"levels/0/render.glb": Path("render.glb"), ...}
+        include_checksums: Whether to include a checksums file
+        checksum_algorithm: One of CHECKSUM_ALGORITHMS; the checksums are
+                            written to checksums.<algorithm>
     
     Returns:
         Path to created .stella file
@@ -41,50 +192,80 @@ def pack_stella(
     Example:
         >>> manifest = make_manifest(title="My World")
         >>> files = {
-        ...     "levels/0/level.json": level_json.to_json().encode(),
-        ...     "levels/0/render.glb": glb_bytes,
+        ...     "levels/0/level.json": level_json.to_json_bytes(),
+        ...     "levels/0/render.glb": Path("render.glb"),
         ...     "levels/0/collision.rlevox": vox_bytes,
         ... }
         >>> pack_stella("output.stella", manifest, files)
     """
     output_path = Path(output_path)
+    if include_checksums:
+        _new_hash(checksum_algorithm)  # fail before writing anything
+    checksum_name = f"checksums.{checksum_algorithm}"
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Convert manifest to JSON bytes
     if isinstance(manifest, Manifest):
-        manifest_bytes = manifest.to_json().encode("utf-8")
+        manifest_bytes = manifest.to_json_bytes()
     else:
-        manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8")
-    
-    # Build complete file map with manifest
-    all_files: Dict[str, bytes] = {"manifest.json": manifest_bytes}
-    all_files.update(file_map)
-    
-    # Generate checksums if requested
-    checksums: Dict[str, str] = {}
-    if include_checksums:
-        for path, data in sorted(all_files.items()):
-            checksums[path] = compute_sha256(data)
+        manifest_bytes = json_dumps_bytes(manifest)
+    
+    # One stable sort of (path, source) records; a caller-supplied
+    # manifest.json or duplicate path sorts after the entry it overrides
+    if isinstance(file_map, dict):
+        file_map = file_map.items()
+    items = [("manifest.json", manifest_bytes), *file_map]
+    items.sort(key=itemgetter(0))
+    
+    # Deterministic order: manifest.json first, the rest sorted, the
+    # checksums file last (generated below when include_checksums is set)
+    entries: List[Tuple[str, FileSource]] = []
+    manifest_entry = checksum_entry = None
+    for i, (path, source) in enumerate(items):
+        if i + 1 < len(items) and items[i + 1][0] == path:
+            continue  # Overridden by a later entry
+        if path == "manifest.json":
+            manifest_entry = (path, source)
+        elif path == checksum_name:
+            checksum_entry = (path, source)
+        else:
+            entries.append((path, source))
+    entries.insert(0, manifest_entry)
+    if checksum_entry is not None and not include_checksums:
+        entries.append(checksum_entry)
+    
+    # Create ZIP. In-memory entries are hashed on worker threads while the
+    # main thread deflates (both release the GIL); streamed entries are
+    # hashed in the same pass that writes them.
+    checksums: List[Tuple[str, Union[str, Future]]] = []
+    with contextlib.ExitStack() as stack:
+        pool = None
+        if include_checksums:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=os.cpu_count()))
+        zf = stack.enter_context(zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED))
+        for path, source in entries:
+            zinfo = _zip_info(path)
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                if pool is not None:
+                    checksums.append((path, pool.submit(compute_checksum, source, checksum_algorithm)))
+                zf.writestr(zinfo, source)
+                continue
+            with _open_source(source) as src, zf.open(zinfo, "w", force_zip64=True) as dst:
+                writer = _HashingWriter(dst, checksum_algorithm)
+                shutil.copyfileobj(src, writer, COPY_CHUNK_SIZE)
+            if include_checksums:
+                checksums.append((path, writer.h.hexdigest()))
         
-        # Create checksums file content
-        checksum_lines = [f"{hash}  {path}" for path, hash in sorted(checksums.items())]
-        all_files["checksums.sha256"] = "\n".join(checksum_lines).encode("utf-8")
-    
-    # Sort paths for deterministic output
-    sorted_paths = sorted(all_files.keys())
-    
-    # Ensure manifest.json is first, checksums.sha256 is last
-    if "manifest.json" in sorted_paths:
-        sorted_paths.remove("manifest.json")
-        sorted_paths.insert(0, "manifest.json")
-    if "checksums.sha256" in sorted_paths:
-        sorted_paths.remove("checksums.sha256")
-        sorted_paths.append("checksums.sha256")
-    
-    # Create ZIP
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for path in sorted_paths:
-            zf.writestr(path, all_files[path])
+        if include_checksums:
+            checksums = [
+                (path, hash if isinstance(hash, str) else hash.result())
+                for path, hash in checksums
+            ]
+            checksum_lines = [f"{hash}  {path}" for path, hash in sorted(checksums)]
+            zf.writestr(
+                _zip_info(checksum_name),
+                "\n".join(checksum_lines).encode("utf-8"),
+            )
     
     return output_path
 
@@ -109,16 +290,9 @@ def unpack_stella(
     """
     stella_path = Path(stella_path)
     
+    manifest = load_manifest(stella_path)
     zf = zipfile.ZipFile(stella_path, "r")
     
-    # Read and parse manifest
-    if "manifest.json" not in zf.namelist():
-        zf.close()
-        raise ValueError("Invalid .stella file: missing manifest.json")
-    
-    manifest_bytes = zf.read("manifest.json")
-    manifest = Manifest.from_json(manifest_bytes.decode("utf-8"))
-    
     # Optionally extract
     if extract_to:
         extract_to = Path(extract_to)
@@ -128,6 +302,168 @@ def unpack_stella(
     return manifest, zf
 
 
+class StellaReader:
+    """
+    Read-only handle on a .stella archive for fetching many members.
+    
+    The ZIP central directory is parsed once when the reader is opened,
+    rather than on every read. Reads may be issued from several threads
+    (member reads use positioned reads on their own handle; zipfile
+    serializes streams opened with open()).
+    
+    Example:
+        >>> with StellaReader("world.stella") as reader:
+        ...     level = reader.level_json("0")
+        ...     glb = reader.read("levels/0/render.glb")
+    """
+    
+    def __init__(self, stella_path: Union[str, Path]):
+        self.path = stella_path
+        self._zf = zipfile.ZipFile(stella_path, "r")
+        self._names = frozenset(self._zf.namelist())
+        self._manifest: Optional[Manifest] = None
+        # Separate handle for whole-member reads that bypass zipfile. Reads
+        # are counted so close() waits for them instead of freeing the fd
+        # mid-read (where a new file could reuse its number)
+        self._fh = open(stella_path, "rb")
+        self._fh_lock = threading.Condition()
+        self._active_reads = 0
+    
+    def __contains__(self, internal_path: str) -> bool:
+        return internal_path in self._names
+    
+    def __enter__(self) -> "StellaReader":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        with self._fh_lock:
+            while self._active_reads:
+                self._fh_lock.wait()
+            self._fh.close()
+        self._zf.close()
+    
+    def read(self, internal_path: str) -> bytes:
+        """
+        Read a member's contents (KeyError if absent).
+        
+        Members are read with positioned reads straight from the file.
+        Stored members come back as read; deflated ones are inflated in a
+        single call into a buffer sized from the central directory (by
+        ISA-L when isal is installed), instead of zipfile's chunked,
+        geometrically grown reads.
+        
+        Raises:
+            KeyError: If the member is absent
+            zipfile.BadZipFile: If the member is corrupt
+        """
+        info = self._zf.getinfo(internal_path)
+        if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED) or info.flag_bits & 0x1:
+            return self._zf.read(info)
+        
+        inflate = isal_zlib if HAS_ISAL else zlib
+        data = self._read_raw(info)
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            data = inflate.decompress(data, -zlib.MAX_WBITS, info.file_size)
+        if len(data) != info.file_size or inflate.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+        return data
+    
+    def read_many(self, internal_paths: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Read several members, in archive order so the file is read front
+        to back.
+        
+        Returns:
+            Dict of path -> contents, in the order requested
+        
+        Raises:
+            KeyError: If any member is absent (before anything is read)
+        """
+        infos = {path: self._zf.getinfo(path) for path in internal_paths}
+        by_offset = sorted(infos, key=lambda path: infos[path].header_offset)
+        contents = {path: self.read(path) for path in by_offset}
+        return {path: contents[path] for path in infos}
+    
+    def _read_raw(self, info: zipfile.ZipInfo) -> bytes:
+        """Read a member's compressed bytes, skipping its local header."""
+        header = self._read_at(info.header_offset, _LOCAL_HEADER.size)
+        if len(header) != _LOCAL_HEADER.size or header[:4] != _LOCAL_HEADER_MAGIC:
+            raise zipfile.BadZipFile(f"Bad magic number for file header of {info.filename!r}")
+        *_, name_length, extra_length = _LOCAL_HEADER.unpack(header)
+        data_offset = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+        raw = self._read_at(data_offset, info.compress_size)
+        if len(raw) != info.compress_size:
+            raise zipfile.BadZipFile(f"Truncated data for file {info.filename!r}")
+        return raw
+    
+    def _read_at(self, offset: int, size: int) -> bytes:
+        """
+        Read up to size bytes at offset, without moving a shared position.
+        
+        Raises:
+            ValueError: If the reader is closed
+        """
+        with self._fh_lock:
+            if self._fh.closed:
+                raise ValueError(f"StellaReader for {self.path} is closed")
+            if not hasattr(os, "pread"):
+                self._fh.seek(offset)
+                return self._fh.read(size)
+            fd = self._fh.fileno()
+            self._active_reads += 1
+        
+        # pread needs no lock; loop since one call may return short (> 2 GiB)
+        try:
+            chunks = []
+            while size > 0:
+                chunk = os.pread(fd, size, offset)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                offset += len(chunk)
+                size -= len(chunk)
+            return b"".join(chunks)
+        finally:
+            with self._fh_lock:
+                self._active_reads -= 1
+                if not self._active_reads:
+                    self._fh_lock.notify_all()
+    
+    def open(self, internal_path: str) -> BinaryIO:
+        """Open a member as a binary stream (KeyError if absent)."""
+        return self._zf.open(internal_path)
+    
+    def manifest(self) -> Manifest:
+        """
+        Parsed manifest (parsed once per reader; returns a copy).
+        
+        Raises:
+            ValueError: If manifest.json is missing or invalid
+        """
+        if self._manifest is None:
+            if "manifest.json" not in self._names:
+                raise ValueError("Invalid .stella file: missing manifest.json")
+            self._manifest = Manifest.from_json(self.read("manifest.json"))
+        return copy.deepcopy(self._manifest)
+    
+    def level_json(self, level_id: str = "0") -> LevelJson:
+        """
+        Read and parse the level.json of a level listed in the manifest.
+        
+        Raises:
+            ValueError: If the level is not in the manifest
+        """
+        if self._manifest is None:
+            self.manifest()
+        level_ref = next((l for l in self._manifest.levels if l.id == level_id), None)
+        if not level_ref:
+            raise ValueError(f"Level {level_id} not found in manifest")
+        return LevelJson.from_json(self.read(level_ref.path))
+
+
 def read_stella_file(
     stella_path: Union[str, Path],
     internal_path: str,
@@ -135,6 +471,9 @@ def read_stella_file(
     """
     Read a single file from a .stella archive.
     
+    The archive is opened and closed per call; use read_stella_files or a
+    StellaReader to fetch many members with one central-directory parse.
+    
     Args:
         stella_path: Path to .stella file
         internal_path: Path within archive (e.g. "levels/0/render.glb")
@@ -142,86 +481,288 @@ def read_stella_file(
     Returns:
         File contents as bytes
     """
-    with zipfile.ZipFile(stella_path, "r") as zf:
-        return zf.read(internal_path)
+    with StellaReader(stella_path) as reader:
+        return reader.read(internal_path)
+
+
+def read_stella_files(
+    stella_path: Union[str, Path],
+    internal_paths: Iterable[str],
+) -> Dict[str, bytes]:
+    """
+    Read several files from a .stella archive in one call.
+    
+    Opens the archive once and reads the members in archive order (see
+    StellaReader.read_many).
+    
+    Args:
+        stella_path: Path to .stella file
+        internal_paths: Paths within archive
+    
+    Returns:
+        Dict of internal path -> contents, in the order requested
+    """
+    with StellaReader(stella_path) as reader:
+        return reader.read_many(internal_paths)
+
+
+def _cache_key(stella_path: Union[str, Path]) -> Tuple[str, int, int]:
+    """Key for per-archive caches; changes whenever the file is rewritten."""
+    path_str = os.path.abspath(os.fspath(stella_path))
+    st = os.stat(path_str)
+    return path_str, st.st_mtime_ns, st.st_size
+
+
+def load_manifest(stella_path: Union[str, Path]) -> Manifest:
+    """
+    Read and parse manifest.json from a .stella file.
+    
+    Parsed manifests are cached per (path, mtime, size); each call returns
+    a fresh copy that the caller may modify.
+    
+    Args:
+        stella_path: Path to .stella file
+    
+    Returns:
+        Manifest instance
+    
+    Raises:
+        ValueError: If manifest.json is missing or invalid
+    """
+    return copy.deepcopy(_load_manifest_cached(*_cache_key(stella_path)))
+
+
+@lru_cache(maxsize=128)
+def _load_manifest_cached(stella_path: str, mtime_ns: int, size: int) -> Manifest:
+    """Parse an archive's manifest; mtime_ns and size only key the cache."""
+    with StellaReader(stella_path) as reader:
+        try:
+            manifest_bytes = reader.read("manifest.json")
+        except KeyError:
+            raise ValueError("Invalid .stella file: missing manifest.json")
+    return Manifest.from_json(manifest_bytes)
+
+
+def clear_manifest_cache() -> None:
+    """Drop all cached manifests and archive summaries."""
+    _load_manifest_cached.cache_clear()
+    _read_stella_info_cached.cache_clear()
 
 
 def get_stella_info(stella_path: Union[str, Path]) -> Dict:
     """
     Get summary information about a .stella file.
     
+    Results are cached per (path, mtime, size), so repeated calls on an
+    unchanged archive skip re-opening and re-parsing it.
+    
     Args:
         stella_path: Path to .stella file
     
     Returns:
         Dict with manifest, file list, and sizes
     """
-    stella_path = Path(stella_path)
+    manifest, paths, compressed_sizes, sizes, archive_size = _read_stella_info_cached(
+        *_cache_key(stella_path)
+    )
+    # Fresh per-file dicts from the cached columns (cheaper than deep-copying
+    # a cached list of dicts)
+    files = [
+        {"path": path, "compressed_size": compressed, "uncompressed_size": uncompressed}
+        for path, compressed, uncompressed in zip(paths, compressed_sizes, sizes)
+    ]
+    return {
+        "manifest": copy.deepcopy(manifest),
+        "files": files,
+        "total_uncompressed_size": sum(sizes),
+        "archive_size": archive_size,
+    }
+
+
+@lru_cache(maxsize=32)
+def _read_stella_info_cached(
+    stella_path: str, mtime_ns: int, size: int,
+) -> Tuple[Dict, Tuple[str, ...], Tuple[int, ...], Tuple[int, ...], int]:
+    """
+    Read the archive summary as columns; mtime_ns and size only key the cache.
     
+    Returns:
+        Tuple of (manifest dict, paths, compressed sizes, uncompressed
+        sizes, archive size)
+    """
+    manifest = _load_manifest_cached(stella_path, mtime_ns, size)
     with zipfile.ZipFile(stella_path, "r") as zf:
-        manifest_bytes = zf.read("manifest.json")
-        manifest = Manifest.from_json(manifest_bytes.decode("utf-8"))
-        
-        files = []
-        total_size = 0
-        for info in zf.infolist():
-            files.append({
-                "path": info.filename,
-                "compressed_size": info.compress_size,
-                "uncompressed_size": info.file_size,
-            })
-            total_size += info.file_size
-        
-        return {
-            "manifest": manifest.to_dict(),
-            "files": files,
-            "total_uncompressed_size": total_size,
-            "archive_size": stella_path.stat().st_size,
-        }
+        infos = zf.infolist()
+    return (
+        manifest.to_dict(),
+        tuple(info.filename for info in infos),
+        tuple(info.compress_size for info in infos),
+        tuple(info.file_size for info in infos),
+        size,
+    )
 
 
-def verify_stella_checksums(stella_path: Union[str, Path]) -> Tuple[bool, List[str]]:
+def verify_stella_checksums(
+    stella_path: Union[str, Path],
+    max_workers: Optional[int] = None,
+) -> Tuple[bool, List[str]]:
     """
     Verify checksums in a .stella file.
     
+    Uses checksums.sha256 or checksums.blake3, whichever is present; if
+    both are, checksums.sha256 is used (the first of CHECKSUM_ALGORITHMS)
+    and checksums.blake3 is ignored. Members are hashed as streams rather than read whole into memory, and
+    in parallel threads (inflate and hashing both release the GIL). Each
+    thread reads through its own ZipFile handle.
+    
     Args:
         stella_path: Path to .stella file
+        max_workers: Maximum number of hashing threads (default: CPU count)
     
     Returns:
         Tuple of (all_valid, list_of_errors)
     """
-    errors = []
-    
     with zipfile.ZipFile(stella_path, "r") as zf:
-        if "checksums.sha256" not in zf.namelist():
-            return True, ["No checksums.sha256 file found (not an error)"]
+        return _verify_checksums(zf, max_workers)
+
+
+def _verify_checksums(
+    zf: zipfile.ZipFile,
+    max_workers: Optional[int] = None,
+    names: Optional[frozenset] = None,
+    preloaded: Optional[Dict[str, bytes]] = None,
+) -> Tuple[bool, List[str]]:
+    """
+    Verify checksums of an already-open archive (see verify_stella_checksums).
+    
+    names may pass in a precomputed frozenset(zf.namelist()); members in
+    preloaded (path -> bytes already read by the caller) are hashed from
+    memory instead of being inflated again.
+    """
+    preloaded = preloaded or {}
+    # Parse errors (str) and members to hash ((path, expected)) in line order
+    entries: List[Union[str, Tuple[str, str]]] = []
+    
+    if names is None:
+        names = frozenset(zf.namelist())
+    algorithm = _checksum_algorithm(names)
+    if algorithm is None:
+        return True, ["No checksums.sha256 file found (not an error)"]
+    
+    checksum_name = f"checksums.{algorithm}"
+    checksum_content = zf.read(checksum_name)
+    
+    for expected_hash, path, malformed in _CHECKSUM_LINE.findall(checksum_content):
+        if malformed:
+            line = malformed.decode("utf-8", errors="replace")
+            entries.append(f"Malformed checksum line: {line}")
+            continue
         
-        checksum_content = zf.read("checksums.sha256").decode("utf-8")
+        expected_hash = expected_hash.decode("ascii")
+        path = path.decode("utf-8")
         
-        for line in checksum_content.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("  ", 1)
-            if len(parts) != 2:
-                errors.append(f"Malformed checksum line: {line}")
-                continue
-            
-            expected_hash, path = parts
-            
-            if path == "checksums.sha256":
-                continue  # Skip self-reference
-            
-            if path not in zf.namelist():
-                errors.append(f"Missing file: {path}")
-                continue
-            
-            actual_hash = compute_sha256(zf.read(path))
-            if actual_hash != expected_hash:
-                errors.append(f"Checksum mismatch for {path}")
+        if path == checksum_name:
+            continue  # Skip self-reference
+        
+        if path not in names:
+            entries.append(f"Missing file: {path}")
+            continue
+        
+        entries.append((path, expected_hash))
+    
+    checks = [
+        entry for entry in entries
+        if isinstance(entry, tuple) and entry[0] not in preloaded
+    ]
+    matches = iter(_verify_members(zf, checks, algorithm, max_workers))
+    
+    errors = []
+    for entry in entries:
+        if isinstance(entry, str):
+            errors.append(entry)
+            continue
+        path, expected_hash = entry
+        if path in preloaded:
+            ok = compute_checksum(preloaded[path], algorithm) == expected_hash
+        else:
+            ok = next(matches)
+        if not ok:
+            errors.append(f"Checksum mismatch for {path}")
     
     return len(errors) == 0, errors
 
 
+def _verify_members(
+    zf: zipfile.ZipFile,
+    checks: List[Tuple[str, str]],
+    algorithm: str,
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """Hash archive members concurrently; returns match flags in order."""
+    # Empty members match the known empty digest without being opened
+    empty_digest = _empty_digest(algorithm)
+    matches: List[Optional[bool]] = [
+        None if zf.getinfo(path).file_size else expected_hash == empty_digest
+        for path, expected_hash in checks
+    ]
+    hashed = iter(_hash_members(
+        zf,
+        [check for check, match in zip(checks, matches) if match is None],
+        algorithm,
+        max_workers,
+    ))
+    return [next(hashed) if match is None else match for match in matches]
+
+
+def _hash_members(
+    zf: zipfile.ZipFile,
+    checks: List[Tuple[str, str]],
+    algorithm: str,
+    max_workers: Optional[int] = None,
+) -> List[bool]:
+    """Stream-hash archive members on a thread pool (see _verify_members)."""
+    n_workers = min(len(checks), max_workers or os.cpu_count() or 1)
+    if n_workers <= 1:
+        # No concurrency, so the caller's handle can be used directly
+        matches = []
+        for path, expected_hash in checks:
+            with zf.open(path) as fh:
+                matches.append(_digest_stream(fh, algorithm) == expected_hash)
+        return matches
+    
+    stella_path = zf.filename
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    
+    def verify_one(check: Tuple[str, str]) -> bool:
+        path, expected_hash = check
+        handle = getattr(local, "zf", None)
+        if handle is None:
+            handle = local.zf = zipfile.ZipFile(stella_path, "r")
+            handles.append(handle)
+        with handle.open(path) as fh:
+            return _digest_stream(fh, algorithm) == expected_hash
+    
+    try:
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            return list(ex.map(verify_one, checks))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _checksum_algorithm(names) -> Optional[str]:
+    """
+    Return the algorithm of the checksums file among archive names, if any.
+    
+    The first match in CHECKSUM_ALGORITHMS order wins when several exist.
+    """
+    for algorithm in CHECKSUM_ALGORITHMS:
+        if f"checksums.{algorithm}" in names:
+            return algorithm
+    return None
+
+
 def get_level_json(
     stella_path: Union[str, Path],
     level_id: str = "0",
@@ -236,17 +777,8 @@ def get_level_json(
     Returns:
         LevelJson instance
     """
-    manifest, zf = unpack_stella(stella_path)
-    
-    try:
-        level_ref = next((l for l in manifest.levels if l.id == level_id), None)
-        if not level_ref:
-            raise ValueError(f"Level {level_id} not found in manifest")
-        
-        level_bytes = zf.read(level_ref.path)
-        return LevelJson.from_json(level_bytes.decode("utf-8"))
-    finally:
-        zf.close()
+    with StellaReader(stella_path) as reader:
+        return reader.level_json(level_id)
 
 
 def list_stella_contents(stella_path: Union[str, Path]) -> List[str]:
@@ -271,7 +803,8 @@ def validate_stella(stella_path: Union[str, Path]) -> Tuple[bool, List[str]]:
     - Valid ZIP archive
     - manifest.json exists and is valid JSON
     - Each level has level.json, render.glb, collision.rlevox
-    - If checksums.sha256 exists, verify file hashes
+    - If checksums.sha256 or checksums.blake3 exists, verify file hashes
+      (checksums.sha256 when both do)
     
     Args:
         stella_path: Path to .stella file
@@ -285,53 +818,55 @@ def validate_stella(stella_path: Union[str, Path]) -> Tuple[bool, List[str]]:
         ...     print(f"Validation failed: {errors}")
     """
     errors = []
-    stella_path = Path(stella_path)
-    
-    # Check file exists
-    if not stella_path.exists():
-        return False, [f"File not found: {stella_path}"]
     
-    # Check valid ZIP
+    # Check file exists and is a valid ZIP (one open, no separate stat)
     try:
         zf = zipfile.ZipFile(stella_path, "r")
+    except FileNotFoundError:
+        return False, [f"File not found: {stella_path}"]
     except zipfile.BadZipFile:
         return False, ["Not a valid ZIP file"]
     
     try:
+        # namelist() builds a new list per call; look names up in a set
+        names = frozenset(zf.namelist())
+        
         # Check manifest exists
-        if "manifest.json" not in zf.namelist():
+        preloaded: Dict[str, bytes] = {}
+        if "manifest.json" not in names:
             errors.append("Missing required file: manifest.json")
         else:
+            manifest_bytes = zf.read("manifest.json")
+            preloaded["manifest.json"] = manifest_bytes
             try:
-                manifest_bytes = zf.read("manifest.json")
-                manifest_data = json.loads(manifest_bytes.decode("utf-8"))
-                
-                # Check manifest has levels
-                if "levels" not in manifest_data:
-                    errors.append("manifest.json missing 'levels' field")
-                elif not manifest_data["levels"]:
-                    errors.append("manifest.json has empty 'levels' array")
-                else:
-                    # Check each level has required files
-                    for level in manifest_data["levels"]:
-                        level_id = level.get("id", "unknown")
-                        level_dir = f"levels/{level_id}/"
-                        
-                        required_files = [
-                            f"{level_dir}level.json",
-                            f"{level_dir}render.glb",
-                            f"{level_dir}collision.rlevox",
-                        ]
-                        
-                        for req_file in required_files:
-                            if req_file not in zf.namelist():
-                                errors.append(f"Missing required file: {req_file}")
+                manifest = Manifest.from_json(manifest_bytes)
             except json.JSONDecodeError as e:
                 errors.append(f"Invalid JSON in manifest.json: {e}")
+            except (ValueError, TypeError) as e:
+                errors.append(f"Invalid manifest.json: {e}")
+            else:
+                # Format, version, axis and level-reference rules
+                errors.extend(manifest.validate())
+                
+                # Check each level has required files
+                for level in manifest.levels:
+                    level_dir = f"levels/{level.id}/"
+                    
+                    required_files = [
+                        f"{level_dir}level.json",
+                        f"{level_dir}render.glb",
+                        f"{level_dir}collision.rlevox",
+                    ]
+                    
+                    for req_file in required_files:
+                        if req_file not in names:
+                            errors.append(f"Missing required file: {req_file}")
         
-        # Verify checksums if present
-        if "checksums.sha256" in zf.namelist():
-            checksum_valid, checksum_errors = verify_stella_checksums(stella_path)
+        # Verify checksums if present (manifest.json is hashed from memory)
+        if _checksum_algorithm(names) is not None:
+            checksum_valid, checksum_errors = _verify_checksums(
+                zf, names=names, preloaded=preloaded
+            )
             if not checksum_valid:
                 errors.extend(checksum_errors)
     
@@ -7,6 +7,7 @@ Converts a 2D floorplan image into a navigable 3D world.
 import os
 import json
 import tempfile
+from io import BytesIO
 from pathlib import Path
 from typing import Optional, Tuple
 import numpy as np
@@ -30,7 +31,14 @@ from stella.manifest import (
 )
 from stella.package import pack_stella
 from stella.vox_rle import write_rlevox
-from stella.geometry import extrude_2d_to_walls, compute_spawn_position
+from stella.geometry import compute_spawn_position, greedy_rectangles
+from stella.glb import compress_glb
+
+# Structuring element for the close/open cleanup of thresholded floorplans
+_MORPH_KERNEL = np.ones((3, 3), np.uint8)
+
+# BGR color of walls in preview_floorplan
+_PREVIEW_WALL_BGR = np.array([0, 0, 255], np.uint8)
 
 
 def build_floorplan(
@@ -42,6 +50,7 @@ def build_floorplan(
     title: str = "Floorplan World",
     invert: bool = False,
     threshold: int = 128,
+    compress: str = "none",
 ) -> str:
     """
     Build a .stella file from a floorplan image.
@@ -55,6 +64,7 @@ def build_floorplan(
         title: World title
         invert: If True, dark pixels are empty (not walls)
         threshold: Grayscale threshold for wall detection
+        compress: Render GLB compression, "none" or "meshopt" (requires gltfpack)
     
     Returns:
         Path to created .stella file
@@ -80,19 +90,11 @@ def build_floorplan(
     if image is None:
         raise ValueError(f"Could not read image: {input_image}")
     
-    # Threshold to binary
-    if invert:
-        _, binary = cv2.threshold(image, threshold, 255, cv2.THRESH_BINARY)
-    else:
-        _, binary = cv2.threshold(image, threshold, 255, cv2.THRESH_BINARY_INV)
-    
-    # Morphological cleanup
-    kernel = np.ones((3, 3), np.uint8)
-    binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-    binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+    # Threshold to binary and clean up
+    binary = _binarize_clean(image, threshold, invert)
     
     # Convert to occupancy grid (True = wall)
-    occupancy_2d = binary > 0
+    occupancy_2d = binary.view(bool)
     
     # Scale based on pixels_per_meter
     # Each pixel in the image = 1/pixels_per_meter meters
@@ -103,17 +105,22 @@ def build_floorplan(
     if scale_factor != 1.0:
         new_height = int(occupancy_2d.shape[0] * scale_factor)
         new_width = int(occupancy_2d.shape[1] * scale_factor)
+        # Nearest-neighbor keeps the 0/1 values, so resize the bool bytes as-is
         occupancy_2d = cv2.resize(
-            occupancy_2d.astype(np.uint8) * 255,
+            occupancy_2d.view(np.uint8),
             (new_width, new_height),
             interpolation=cv2.INTER_NEAREST
-        ) > 127
+        ).view(bool)
     
     print(f"Occupancy grid size: {occupancy_2d.shape}")
     
-    # Extrude to 3D
+    # Extrude to 3D: walls are uniform along y, so a read-only broadcast
+    # view stands in for the materialized extrude_2d_to_walls copy
     dim_y = int(np.ceil(wall_height / voxel_size))
-    grid_3d = extrude_2d_to_walls(occupancy_2d, 0, wall_height, voxel_size)
+    grid_3d = np.broadcast_to(
+        occupancy_2d[:, None, :],
+        (occupancy_2d.shape[0], dim_y, occupancy_2d.shape[1]),
+    )
     
     # Note: grid_3d is [x, y, z] where x corresponds to image rows, z to columns
     # We need to transpose to match our coordinate system
@@ -143,22 +150,26 @@ def build_floorplan(
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir = Path(tmpdir)
         
-        # Write collision data
-        collision_path = tmpdir / "collision.rlevox"
-        write_rlevox(collision_path, grid_3d, voxel_size, origin)
+        # Write collision data (RLE is small, keep it in memory)
+        collision_buf = BytesIO()
+        write_rlevox(collision_buf, grid_3d, voxel_size, origin)
         print(f"Collision data written: {grid_3d.sum()} solid voxels")
         
         # Write render mesh
-        render_path = tmpdir / "render.glb"
-        mesh.export(str(render_path))
+        raw_render_path = tmpdir / "render_raw.glb"
+        mesh.export(str(raw_render_path))
         print(f"Render mesh written: {len(mesh.vertices)} vertices, {len(mesh.faces)} faces")
         
+        render_path, render_extensions = compress_glb(raw_render_path, tmpdir / "render.glb", compress)
+        
         # Create level.json
         level_json = make_level_json(
             name="Floor 0",
             spawn_position=spawn_pos,
             player_height=1.7,
         )
+        if render_extensions:
+            level_json.render.extensions = render_extensions
         
         # Create manifest
         manifest = make_manifest(
@@ -166,11 +177,11 @@ def build_floorplan(
             tags=["floorplan", "generated"],
         )
         
-        # Read file bytes
+        # Large assets are streamed from disk by pack_stella
         file_map = {
-            "levels/0/level.json": level_json.to_json().encode("utf-8"),
-            "levels/0/render.glb": render_path.read_bytes(),
-            "levels/0/collision.rlevox": collision_path.read_bytes(),
+            "levels/0/level.json": level_json.to_json_bytes(),
+            "levels/0/render.glb": render_path,
+            "levels/0/collision.rlevox": collision_buf.getvalue(),
         }
         
         # Pack stella file
@@ -180,6 +191,108 @@ def build_floorplan(
     return str(output_path)
 
 
+def _binarize_clean(image: np.ndarray, threshold: int, invert: bool) -> np.ndarray:
+    """
+    Threshold a grayscale floorplan to a wall mask and close/open it.
+    
+    Args:
+        image: Grayscale image
+        threshold: Grayscale threshold for wall detection
+        invert: If True, light pixels are walls
+    
+    Returns:
+        uint8 mask holding 0 or 1 (1 = wall), so it can be viewed as bool
+    """
+    mode = cv2.THRESH_BINARY if invert else cv2.THRESH_BINARY_INV
+    _, binary = cv2.threshold(image, threshold, 1, mode)
+    
+    binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, _MORPH_KERNEL)
+    return cv2.morphologyEx(binary, cv2.MORPH_OPEN, _MORPH_KERNEL)
+
+
+def _runs(mask: np.ndarray, axis: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find maximal runs of set cells along an axis of a 2D mask.
+    
+    Returns:
+        (line, start, length) arrays; line indexes the other axis
+    """
+    lines = mask if axis == 1 else mask.T
+    edges = np.diff(np.pad(lines, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    line, start = np.nonzero(edges == 1)
+    _, end = np.nonzero(edges == -1)
+    return line, start, end - start
+
+
+# Corner patterns for one wall quad, counter-clockwise seen from outside.
+# Each side quad spans a run [start, end) along its run axis and y in [0, 1]:
+# (run-axis pattern, y pattern) with 0 = start / bottom, 1 = end / top
+_SIDE_QUAD_PATTERNS = {
+    "-x": ([0, 1, 1, 0], [0, 0, 1, 1]),
+    "+x": ([0, 0, 1, 1], [0, 1, 1, 0]),
+    "-z": ([0, 0, 1, 1], [0, 1, 1, 0]),
+    "+z": ([0, 1, 1, 0], [0, 0, 1, 1]),
+}
+
+
+def _side_quads(
+    plane: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    side: str,
+) -> np.ndarray:
+    """Build (N, 4, 3) side quads in plane x (for ±x) or z (for ±z) = plane."""
+    run_pattern, y_pattern = (np.asarray(p, dtype=np.float64) for p in _SIDE_QUAD_PATTERNS[side])
+    run = start[:, None] + (end - start)[:, None] * run_pattern
+    fixed = np.broadcast_to(plane[:, None].astype(np.float64), run.shape)
+    y = np.broadcast_to(y_pattern, run.shape)
+    if side in ("-x", "+x"):
+        return np.stack([fixed, y, run], axis=-1)
+    return np.stack([run, y, fixed], axis=-1)
+
+
+def _wall_quads(occupancy_2d: np.ndarray) -> np.ndarray:
+    """
+    Exposed wall surfaces of a 2D occupancy grid as quads in cell units.
+    
+    Side faces are only emitted where the neighboring cell is empty, and
+    merged along each wall run; tops are merged into greedy rectangles.
+    Wall bottoms rest on the floor and are skipped. Corners are [x, y, z]
+    with y in [0, 1].
+    
+    Returns:
+        (N, 4, 3) float64 quad corners
+    """
+    occ = occupancy_2d
+    
+    # Cells whose neighbor on each side is empty (or outside the grid)
+    exposed = {side: occ.copy() for side in _SIDE_QUAD_PATTERNS}
+    exposed["-x"][1:] &= ~occ[:-1]
+    exposed["+x"][:-1] &= ~occ[1:]
+    exposed["-z"][:, 1:] &= ~occ[:, :-1]
+    exposed["+z"][:, :-1] &= ~occ[:, 1:]
+    
+    quads = []
+    
+    # Tops (+y), one quad per greedy rectangle
+    rects = np.array(greedy_rectangles(occ), dtype=np.float64).reshape(-1, 4)
+    u0, v0 = rects[:, 0:1], rects[:, 1:2]
+    u1, v1 = u0 + rects[:, 2:3], v0 + rects[:, 3:4]
+    tops = np.empty((len(rects), 4, 3))
+    tops[..., 0] = np.hstack([u0, u0, u1, u1])
+    tops[..., 1] = 1.0
+    tops[..., 2] = np.hstack([v0, v1, v1, v0])
+    quads.append(tops)
+    
+    # ±x faces lie in planes x = u / u + 1 with runs along z; ±z faces in
+    # planes z = v / v + 1 with runs along x
+    for side, axis, offset in (("-x", 1, 0), ("+x", 1, 1), ("-z", 0, 0), ("+z", 0, 1)):
+        line, start, length = _runs(exposed[side], axis=axis)
+        quads.append(_side_quads(line + offset, start, start + length, side))
+    
+    return np.concatenate(quads)
+
+
 def create_wall_mesh_from_2d(
     occupancy_2d: np.ndarray,
     wall_height: float,
@@ -188,6 +301,11 @@ def create_wall_mesh_from_2d(
     """
     Create a mesh from 2D occupancy grid by extruding walls.
     
+    Only exposed wall surfaces are emitted: side faces where the
+    neighboring pixel is empty, merged along each wall run, and tops
+    merged into rectangles. Faces between adjacent wall pixels and wall
+    bottoms (hidden by the floor) are skipped.
+    
     Args:
         occupancy_2d: 2D boolean array (True = wall)
         wall_height: Height of walls in meters
@@ -196,74 +314,28 @@ def create_wall_mesh_from_2d(
     Returns:
         trimesh.Trimesh mesh
     """
-    vertices = []
-    faces = []
-    vertex_offset = 0
-    
+    occupancy_2d = np.asarray(occupancy_2d, dtype=bool)
     dim_x, dim_z = occupancy_2d.shape
     
-    # For each wall pixel, create a box
-    wall_indices = np.argwhere(occupancy_2d)
+    # All wall quads at once, scaled from cell units to meters
+    scale = np.array([voxel_size, wall_height, voxel_size])
+    quads = _wall_quads(occupancy_2d) * scale
+    n_quads = len(quads)
     
-    for idx in wall_indices:
-        x, z = idx
-        
-        # Box corners
-        x0 = x * voxel_size
-        x1 = (x + 1) * voxel_size
-        z0 = z * voxel_size
-        z1 = (z + 1) * voxel_size
-        y0 = 0
-        y1 = wall_height
-        
-        # 8 vertices of the box
-        box_verts = [
-            [x0, y0, z0],  # 0
-            [x1, y0, z0],  # 1
-            [x1, y1, z0],  # 2
-            [x0, y1, z0],  # 3
-            [x0, y0, z1],  # 4
-            [x1, y0, z1],  # 5
-            [x1, y1, z1],  # 6
-            [x0, y1, z1],  # 7
-        ]
-        
-        # 12 triangles (2 per face)
-        box_faces = [
-            # Front
-            [0, 2, 1], [0, 3, 2],
-            # Back
-            [4, 5, 6], [4, 6, 7],
-            # Left
-            [0, 4, 7], [0, 7, 3],
-            # Right
-            [1, 2, 6], [1, 6, 5],
-            # Bottom
-            [0, 1, 5], [0, 5, 4],
-            # Top
-            [3, 6, 2], [3, 7, 6],
-        ]
-        
-        vertices.extend(box_verts)
-        faces.extend([[f[0] + vertex_offset, f[1] + vertex_offset, f[2] + vertex_offset] for f in box_faces])
-        vertex_offset += 8
+    quad_offsets = np.arange(n_quads, dtype=np.int32)[:, None, None] * 4
+    quad_faces = (np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32) + quad_offsets).reshape(-1, 3)
     
     # Add floor plane
-    floor_verts = [
+    floor_verts = np.array([
         [0, 0, 0],
         [dim_x * voxel_size, 0, 0],
         [dim_x * voxel_size, 0, dim_z * voxel_size],
         [0, 0, dim_z * voxel_size],
-    ]
-    floor_faces = [
-        [vertex_offset + 0, vertex_offset + 2, vertex_offset + 1],
-        [vertex_offset + 0, vertex_offset + 3, vertex_offset + 2],
-    ]
-    vertices.extend(floor_verts)
-    faces.extend(floor_faces)
+    ])
+    floor_faces = np.array([[0, 2, 1], [0, 3, 2]], dtype=np.int32) + 4 * n_quads
     
-    vertices = np.array(vertices, dtype=np.float32)
-    faces = np.array(faces, dtype=np.int32)
+    vertices = np.concatenate([quads.reshape(-1, 3), floor_verts]).astype(np.float32)
+    faces = np.concatenate([quad_faces, floor_faces]).astype(np.int32)
     
     mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
     
@@ -296,17 +368,9 @@ def preview_floorplan(
     if image is None:
         raise ValueError(f"Could not read image: {input_image}")
     
-    if invert:
-        _, binary = cv2.threshold(image, threshold, 255, cv2.THRESH_BINARY)
-    else:
-        _, binary = cv2.threshold(image, threshold, 255, cv2.THRESH_BINARY_INV)
-    
-    kernel = np.ones((3, 3), np.uint8)
-    binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-    binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+    binary = _binarize_clean(image, threshold, invert)
     
-    # Create preview
-    preview = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-    preview[binary > 0] = [0, 0, 255]  # Red for walls
+    # Create preview: gray image, walls in red, in one broadcast select
+    preview = np.where(binary.view(bool)[:, :, None], _PREVIEW_WALL_BGR, image[:, :, None])
     
     return preview
@@ -4,12 +4,14 @@ Video to .stella pipeline using MASt3R-SLAM.
 Converts video input into a navigable 3D world by running SLAM reconstruction.
 """
 
+import glob
 import os
 import sys
 import tempfile
+from io import BytesIO
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List, Union
 import numpy as np
 
 try:
@@ -18,6 +20,12 @@ try:
 except ImportError:
     HAS_TRIMESH = False
 
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
 from stella.manifest import make_manifest, make_level_json
 from stella.package import pack_stella
 from stella.vox_rle import write_rlevox, voxelize_points
@@ -26,6 +34,13 @@ from stella.geometry import (
     align_to_gravity,
     compute_spawn_position,
 )
+from stella.glb import compress_glb
+
+# MASt3R-SLAM roots found by _find_mast3r_root, keyed by working directory
+_MAST3R_ROOT_CACHE: Dict[Path, str] = {}
+
+# Random source for point subsampling (seeded so builds are reproducible)
+_RNG = np.random.default_rng(0)
 
 
 def build_video(
@@ -36,6 +51,7 @@ def build_video(
     title: str = "Video Scan",
     mast3r_path: Optional[str] = None,
     use_existing_ply: Optional[str] = None,
+    compress: str = "none",
 ) -> str:
     """
     Build a .stella file from a video using MASt3R-SLAM.
@@ -48,6 +64,7 @@ def build_video(
         title: World title
         mast3r_path: Path to MASt3R-SLAM main.py (auto-detected if None)
         use_existing_ply: Skip SLAM and use existing .ply file
+        compress: Render GLB compression, "none" or "meshopt" (requires gltfpack)
     
     Returns:
         Path to created .stella file
@@ -132,22 +149,26 @@ def build_video(
         print("Creating render mesh...")
         mesh = create_render_mesh_from_points(aligned_points, colors)
         
-        # Write collision
-        collision_path = tmpdir / "collision.rlevox"
-        write_rlevox(collision_path, grid, voxel_size, origin)
+        # Write collision (RLE is small, keep it in memory)
+        collision_buf = BytesIO()
+        write_rlevox(collision_buf, grid, voxel_size, origin)
         print(f"Collision: {grid.sum()} solid voxels")
         
         # Write render
-        render_path = tmpdir / "render.glb"
-        mesh.export(str(render_path))
+        raw_render_path = tmpdir / "render_raw.glb"
+        mesh.export(str(raw_render_path))
         print(f"Render mesh: {len(mesh.vertices)} vertices")
         
+        render_path, render_extensions = compress_glb(raw_render_path, tmpdir / "render.glb", compress)
+        
         # Create level.json
         level_json = make_level_json(
             name="Scanned Space",
             spawn_position=spawn_pos,
             player_height=1.7,
         )
+        if render_extensions:
+            level_json.render.extensions = render_extensions
         level_json.capture = {
             "source": "video_slam",
             "notes": f"Generated from {input_path.name}",
@@ -161,9 +182,9 @@ def build_video(
         
         # Pack stella
         file_map = {
-            "levels/0/level.json": level_json.to_json().encode("utf-8"),
-            "levels/0/render.glb": render_path.read_bytes(),
-            "levels/0/collision.rlevox": collision_path.read_bytes(),
+            "levels/0/level.json": level_json.to_json_bytes(),
+            "levels/0/render.glb": render_path,
+            "levels/0/collision.rlevox": collision_buf.getvalue(),
         }
         
         output_path = pack_stella(output_stella, manifest, file_map)
@@ -172,6 +193,35 @@ def build_video(
     return str(output_path)
 
 
+def _find_mast3r_root() -> Optional[str]:
+    """
+    Locate the MASt3R-SLAM checkout next to this package or in the cwd.
+    
+    Successful lookups are cached per working directory.
+    
+    Returns:
+        Path to the MASt3R-SLAM root, or None if not found
+    """
+    cwd = Path.cwd()
+    if cwd in _MAST3R_ROOT_CACHE:
+        return _MAST3R_ROOT_CACHE[cwd]
+    
+    # Try to find it relative to this package
+    possible_paths = [
+        Path(__file__).parent.parent.parent.parent,  # Up 4 levels to MASt3R-SLAM-main 2
+        Path(__file__).parent.parent.parent,  # Up 3 levels  
+        cwd,
+    ]
+    
+    for p in possible_paths:
+        main_py = p / "main.py"
+        if main_py.exists() and (p / "mast3r_slam").exists():
+            _MAST3R_ROOT_CACHE[cwd] = str(p)
+            return str(p)
+    
+    return None
+
+
 def run_mast3r_slam(
     input_video: str,
     output_dir: str,
@@ -194,18 +244,7 @@ def run_mast3r_slam(
     """
     # Find MASt3R-SLAM
     if mast3r_path is None:
-        # Try to find it relative to this package
-        possible_paths = [
-            Path(__file__).parent.parent.parent.parent,  # Up 4 levels to MASt3R-SLAM-main 2
-            Path(__file__).parent.parent.parent,  # Up 3 levels  
-            Path.cwd(),
-        ]
-        
-        for p in possible_paths:
-            main_py = p / "main.py"
-            if main_py.exists() and (p / "mast3r_slam").exists():
-                mast3r_path = str(p)
-                break
+        mast3r_path = _find_mast3r_root()
         
         if mast3r_path is None:
             raise FileNotFoundError(
@@ -272,11 +311,10 @@ def run_mast3r_slam(
             print(f"Found PLY output: {ply_path}")
             return str(ply_path)
     
-    # Search for any PLY file
-    for ply in mast3r_root.glob("logs/**/*.ply"):
-        if video_name in ply.name:
-            print(f"Found PLY output: {ply}")
-            return str(ply)
+    # Search for any PLY file named after the video, stopping at the first
+    for ply in mast3r_root.glob(f"logs/**/*{glob.escape(video_name)}*.ply"):
+        print(f"Found PLY output: {ply}")
+        return str(ply)
     
     raise FileNotFoundError(
         f"Could not find output PLY for {video_name}. "
@@ -294,6 +332,10 @@ def load_point_cloud(ply_path: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
     Returns:
         Tuple of (points, colors) arrays
     """
+    cloud = _read_binary_ply_points(ply_path)
+    if cloud is not None:
+        return cloud
+    
     mesh = trimesh.load(ply_path)
     
     if hasattr(mesh, 'vertices'):
@@ -310,36 +352,121 @@ def load_point_cloud(ply_path: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
     return points, colors
 
 
+# PLY scalar property types to numpy type codes
+_PLY_TYPES = {
+    b"char": "i1", b"int8": "i1", b"uchar": "u1", b"uint8": "u1",
+    b"short": "i2", b"int16": "i2", b"ushort": "u2", b"uint16": "u2",
+    b"int": "i4", b"int32": "i4", b"uint": "u4", b"uint32": "u4",
+    b"float": "f4", b"float32": "f4", b"double": "f8", b"float64": "f8",
+}
+
+_PLY_BYTE_ORDER = {b"binary_little_endian": "<", b"binary_big_endian": ">"}
+
+
+def _read_binary_ply_points(
+    ply_path: str,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Read a colored binary point cloud PLY straight into numpy.
+    
+    Only handles files whose first element is a vertex element of scalar
+    properties with x/y/z and red/green/blue, and no faces (the MASt3R-SLAM
+    output); anything else returns None so the caller can fall back to
+    trimesh.
+    
+    Args:
+        ply_path: Path to PLY file
+    
+    Returns:
+        Tuple of (points Nx3 float64, colors Nx3 uint8), or None
+    """
+    with open(ply_path, "rb") as f:
+        if f.readline().strip() != b"ply":
+            return None
+        
+        byte_order = None
+        elements = []  # [name, count, [(property, type code)]]
+        for line in f:
+            words = line.split()
+            if not words or words[0] in (b"comment", b"obj_info"):
+                continue
+            if words[0] == b"end_header":
+                break
+            if words[0] == b"format" and len(words) == 3:
+                byte_order = _PLY_BYTE_ORDER.get(words[1])
+            elif words[0] == b"element" and len(words) == 3:
+                elements.append([words[1], int(words[2]), []])
+            elif words[0] == b"property" and len(words) == 3 and elements:
+                if words[1] not in _PLY_TYPES:
+                    return None
+                elements[-1][2].append((words[2].decode("ascii"), _PLY_TYPES[words[1]]))
+            else:
+                return None  # List properties or an unknown header line
+        else:
+            return None
+        
+        if byte_order is None or not elements or elements[0][0] != b"vertex":
+            return None
+        if any(name == b"face" and count > 0 for name, count, _ in elements):
+            return None
+        
+        _, count, properties = elements[0]
+        names = [name for name, _ in properties]
+        if not {"x", "y", "z", "red", "green", "blue"}.issubset(names):
+            return None
+        
+        dtype = np.dtype([(name, byte_order + code) for name, code in properties])
+        vertices = np.fromfile(f, dtype=dtype, count=count)
+    
+    if len(vertices) != count:
+        return None
+    
+    points = np.empty((count, 3), dtype=np.float64)
+    colors = np.empty((count, 3), dtype=np.uint8)
+    for i, axis in enumerate(("x", "y", "z")):
+        points[:, i] = vertices[axis]
+    for i, channel in enumerate(("red", "green", "blue")):
+        colors[:, i] = vertices[channel]
+    return points, colors
+
+
 def clean_occupancy_grid(grid: np.ndarray) -> np.ndarray:
     """
     Clean up an occupancy grid by removing noise.
     
+    2D grids are labeled with OpenCV when available (4-connected, same as
+    scipy's default), 3D grids with scipy.ndimage.
+    
     Args:
-        grid: 3D boolean array
+        grid: 2D or 3D boolean array
     
     Returns:
         Cleaned grid
     """
-    try:
-        from scipy import ndimage
+    if grid.ndim == 2 and HAS_CV2:
+        num_features, labeled, stats, _ = cv2.connectedComponentsWithStats(
+            grid.astype(np.uint8), connectivity=4, ltype=cv2.CV_32S
+        )
+        num_features -= 1  # Label 0 is the background
+        component_sizes = stats[:, cv2.CC_STAT_AREA]
+    else:
+        try:
+            from scipy import ndimage
+        except ImportError:
+            return grid  # scipy not available, skip cleaning
         
         # Remove small floating components
         labeled, num_features = ndimage.label(grid)
-        if num_features > 0:
-            component_sizes = ndimage.sum(grid, labeled, range(1, num_features + 1))
-            
-            # Keep components larger than threshold
-            min_size = max(10, grid.sum() * 0.001)  # At least 0.1% of total
-            
-            cleaned = np.zeros_like(grid)
-            for i, size in enumerate(component_sizes, 1):
-                if size >= min_size:
-                    cleaned |= (labeled == i)
-            
-            return cleaned
+        component_sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)
+    
+    if num_features > 0:
+        # Keep components larger than threshold
+        min_size = max(10, grid.sum() * 0.001)  # At least 0.1% of total
         
-    except ImportError:
-        pass  # scipy not available, skip cleaning
+        # Per-label keep table, applied in one gather over the grid
+        keep = component_sizes >= min_size
+        keep[0] = False  # Background
+        return keep[labeled].astype(grid.dtype, copy=False)
     
     return grid
 
@@ -347,57 +474,45 @@ def clean_occupancy_grid(grid: np.ndarray) -> np.ndarray:
 def create_render_mesh_from_points(
     points: np.ndarray,
     colors: Optional[np.ndarray] = None,
-) -> "trimesh.Trimesh":
+) -> Union["trimesh.PointCloud", "trimesh.Trimesh"]:
     """
-    Create a render mesh from point cloud.
+    Create a render point cloud from points.
     
-    For MVP, creates point cloud visualization.
+    Exported to GLB as a single POINTS primitive (mode 0) with one
+    vertex per point, instead of a tessellated sphere per point.
     Future: Poisson/ball-pivoting reconstruction.
     
     Args:
         points: Nx3 array of points
-        colors: Optional Nx3 array of RGB colors (0-255)
+        colors: Optional Nx3 array of RGB colors (0-255 or 0-1)
     
     Returns:
-        trimesh object
+        trimesh.PointCloud, or an empty trimesh.Trimesh when there are no points
     """
-    # Create point cloud as tiny spheres for GLB export
-    # (GLB doesn't directly support point clouds)
-    
     # For efficiency, subsample if too many points
     max_points = 50000
     if len(points) > max_points:
-        indices = np.random.choice(len(points), max_points, replace=False)
+        # Generator.choice samples k << n without building a full permutation
+        indices = _RNG.choice(len(points), max_points, replace=False, shuffle=False)
         points = points[indices]
         if colors is not None:
             colors = colors[indices]
     
-    # Create small icospheres at each point
-    sphere = trimesh.creation.icosphere(subdivisions=0, radius=0.01)
-    
-    meshes = []
-    for i, pt in enumerate(points):
-        s = sphere.copy()
-        s.apply_translation(pt)
-        
-        if colors is not None:
-            color = colors[i]
-            if color.max() <= 1.0:
-                color = (color * 255).astype(np.uint8)
-            s.visual.vertex_colors = np.tile(
-                np.append(color, 255),
-                (len(s.vertices), 1)
-            )
-        
-        meshes.append(s)
-    
-    # Combine all spheres
-    if meshes:
-        combined = trimesh.util.concatenate(meshes)
-    else:
-        combined = trimesh.Trimesh()
-    
-    return combined
+    if len(points) == 0:
+        # An empty PointCloud cannot be exported to GLB; an empty Trimesh can
+        return trimesh.Trimesh()
+    
+    rgba = None
+    if colors is not None:
+        colors = np.asarray(colors)
+        # Per point, colors in [0, 1] are scaled to 0-255
+        normalized = colors.max(axis=1, keepdims=True) <= 1.0
+        rgb = np.where(normalized, colors.astype(np.float64) * 255, colors)
+        rgba = np.empty((len(rgb), 4), dtype=np.uint8)
+        rgba[:, :3] = np.clip(rgb, 0, 255)
+        rgba[:, 3] = 255
+    
+    return trimesh.PointCloud(np.asarray(points), colors=rgba)
 
 
 def estimate_scale_from_video(video_path: str) -> float:
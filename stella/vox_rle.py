@@ -25,10 +25,19 @@ RLE format:
 - Sum of run lengths must equal dim_x
 """
 
+import contextlib
+import math
+import mmap
 import struct
 import numpy as np
 from pathlib import Path
-from typing import Union, Tuple, Optional
+from typing import BinaryIO, Union, Tuple, Optional
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
 # Constants
 MAGIC = b"STVX"
@@ -36,31 +45,43 @@ VERSION = 1
 HEADER_SIZE = 64
 ENCODING = b"RLE1"
 
+# Header fields: magic, version, header size, dims, voxel size, origin,
+# encoding, reserved (44 bytes, zero-padded to HEADER_SIZE)
+_HEADER = struct.Struct("<4sHH3If3f4sI")
+
+# One RLE run record: (length: uint16, value: uint8, flags: uint8)
+RUN_DTYPE = np.dtype([("length", "<u2"), ("value", "u1"), ("flags", "u1")])
+MAX_RUN_LENGTH = 65535
+
 
 def write_rlevox(
-    path: Union[str, Path],
+    path: Union[str, Path, BinaryIO],
     grid: np.ndarray,
     voxel_size: float,
     origin: Tuple[float, float, float],
-) -> None:
+) -> int:
     """
     Write a voxel grid to RLEVOX format.
     
+    The payload is encoded in memory first, then written after the header
+    in one call; nothing is created if encoding fails.
+    
     Args:
-        path: Output file path
+        path: Output file path, or a writable binary file object
         grid: 3D boolean numpy array with shape [dim_x, dim_y, dim_z]
               True = solid, False = empty
         voxel_size: Size of each voxel in meters
         origin: World-space origin (x, y, z) of voxel [0,0,0]
     
+    Returns:
+        Number of bytes written (header + payload)
+    
     Example:
         >>> grid = np.zeros((100, 50, 100), dtype=bool)
         >>> grid[10:90, 0:3, 10:90] = True  # Floor
         >>> grid[10:12, 0:30, 10:90] = True  # Wall
-        >>> write_rlevox("collision.rlevox", grid, 0.1, (0.0, 0.0, 0.0))
+        >>> n_bytes = write_rlevox("collision.rlevox", grid, 0.1, (0.0, 0.0, 0.0))
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
     grid = np.asarray(grid, dtype=bool)
     
     if grid.ndim != 3:
@@ -69,60 +90,80 @@ def write_rlevox(
     dim_x, dim_y, dim_z = grid.shape
     origin_x, origin_y, origin_z = origin
     
-    with open(path, "wb") as f:
-        # Write header
-        f.write(MAGIC)  # 4 bytes
-        f.write(struct.pack("<H", VERSION))  # 2 bytes
-        f.write(struct.pack("<H", HEADER_SIZE))  # 2 bytes
-        
-        f.write(struct.pack("<I", dim_x))  # 4 bytes
-        f.write(struct.pack("<I", dim_y))  # 4 bytes
-        f.write(struct.pack("<I", dim_z))  # 4 bytes
-        
-        f.write(struct.pack("<f", voxel_size))  # 4 bytes
-        
-        f.write(struct.pack("<f", origin_x))  # 4 bytes
-        f.write(struct.pack("<f", origin_y))  # 4 bytes
-        f.write(struct.pack("<f", origin_z))  # 4 bytes
-        
-        f.write(ENCODING)  # 4 bytes
-        f.write(struct.pack("<I", 0))  # 4 bytes reserved
-        
-        # Pad to header size (64 bytes total)
-        # 4+2+2+4+4+4+4+4+4+4+4+4 = 44 bytes written, need 20 more
-        current_pos = f.tell()
-        if current_pos < HEADER_SIZE:
-            f.write(b"\x00" * (HEADER_SIZE - current_pos))
-        
-        # Write RLE payload
-        # Iterate z, then y, encoding runs along x
-        for z in range(dim_z):
-            for y in range(dim_y):
-                row = grid[:, y, z]
-                runs = _encode_rle_row(row)
-                for run_length, value in runs:
-                    # Split long runs (run_length max is 65535)
-                    remaining = run_length
-                    while remaining > 0:
-                        chunk = min(remaining, 65535)
-                        f.write(struct.pack("<H", chunk))  # run_length
-                        f.write(struct.pack("<B", value))  # value (0 or 1)
-                        f.write(struct.pack("<B", 0))  # flags (reserved)
-                        remaining -= chunk
+    payload = _encode_payload(grid)
+    
+    if hasattr(path, "write"):
+        output = contextlib.nullcontext(path)
+    else:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        output = open(path, "wb")
+    
+    with output as f:
+        # Write header, zero-padded to HEADER_SIZE
+        header = _HEADER.pack(
+            MAGIC, VERSION, HEADER_SIZE,
+            dim_x, dim_y, dim_z,
+            voxel_size,
+            origin_x, origin_y, origin_z,
+            ENCODING, 0,  # reserved
+        )
+        f.write(header.ljust(HEADER_SIZE, b"\x00"))
+        f.write(payload)
+    
+    return HEADER_SIZE + len(payload)
+
+
+def _encode_payload(grid: np.ndarray) -> Union[bytes, np.ndarray]:
+    """
+    Encode a 3D boolean grid into the RLE payload, built in one buffer.
+    
+    Args:
+        grid: 3D boolean array [dim_x, dim_y, dim_z]
+    
+    Returns:
+        Payload bytes (a uint8 array on the Numba path)
+    """
+    dim_x = grid.shape[0]
+    if dim_x == 0:
+        return b""
+    
+    # Iterate z, then y, encoding runs along x; a [z, y, x] copy makes
+    # each row contiguous instead of striding dim_y * dim_z bytes
+    rows = np.ascontiguousarray(grid.transpose(2, 1, 0)).reshape(-1, dim_x)
+    if HAS_NUMBA:
+        # Counted, then filled into an exact-size buffer
+        flat = rows.view(np.uint8).reshape(-1)
+        words = flat[:len(flat) & ~7].view(np.uint64)
+        return _encode_run_rows(flat, words, len(rows), dim_x)
+    
+    # A run starts wherever the value changes or a new row begins; one mask
+    # over the whole grid instead of encoding row by row
+    flat = rows.view(np.uint8).reshape(-1)
+    starts = np.empty(len(flat), dtype=bool)
+    np.not_equal(flat[1:], flat[:-1], out=starts[1:])
+    starts[::dim_x] = True
+    starts = np.flatnonzero(starts)
+    return _pack_runs(np.diff(starts, append=len(flat)), flat[starts])
 
 
 def read_rlevox(
     path: Union[str, Path],
-) -> Tuple[np.ndarray, float, Tuple[float, float, float]]:
+    lazy: bool = False,
+) -> Tuple[Union[np.ndarray, "RLEGrid"], float, Tuple[float, float, float]]:
     """
     Read a RLEVOX file and return the voxel grid.
     
     Args:
         path: Path to .rlevox file
+        lazy: Return an RLEGrid that answers queries from the runs instead
+              of expanding the dense array
     
     Returns:
         Tuple of:
-        - grid: 3D boolean numpy array [dim_x, dim_y, dim_z]
+        - grid: 3D boolean numpy array [dim_x, dim_y, dim_z], stored
+          x-fastest like the payload (a transposed view, not C-contiguous),
+          or an RLEGrid if lazy
         - voxel_size: Size of each voxel in meters  
         - origin: World-space origin (x, y, z) of voxel [0,0,0]
     
@@ -133,62 +174,142 @@ def read_rlevox(
     
     with open(path, "rb") as f:
         # Read and verify magic
-        magic = f.read(4)
+        header = f.read(_HEADER.size)
+        magic = header[:4]
         if magic != MAGIC:
             raise ValueError(f"Invalid magic: {magic}, expected {MAGIC}")
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Truncated header: {len(header)} bytes")
+        
+        (
+            _, version, header_size,
+            dim_x, dim_y, dim_z,
+            voxel_size,
+            origin_x, origin_y, origin_z,
+            encoding, _reserved,
+        ) = _HEADER.unpack(header)
         
-        version = struct.unpack("<H", f.read(2))[0]
         if version != VERSION:
             raise ValueError(f"Unsupported version: {version}")
         
-        header_size = struct.unpack("<H", f.read(2))[0]
-        
-        dim_x = struct.unpack("<I", f.read(4))[0]
-        dim_y = struct.unpack("<I", f.read(4))[0]
-        dim_z = struct.unpack("<I", f.read(4))[0]
-        
-        voxel_size = struct.unpack("<f", f.read(4))[0]
-        
-        origin_x = struct.unpack("<f", f.read(4))[0]
-        origin_y = struct.unpack("<f", f.read(4))[0]
-        origin_z = struct.unpack("<f", f.read(4))[0]
-        
-        encoding = f.read(4)
         if encoding != ENCODING:
             raise ValueError(f"Unsupported encoding: {encoding}")
         
-        _reserved = struct.unpack("<I", f.read(4))[0]
-        
-        # Skip to payload
-        f.seek(header_size)
-        
-        # Read RLE payload
-        grid = np.zeros((dim_x, dim_y, dim_z), dtype=bool)
-        
-        for z in range(dim_z):
-            for y in range(dim_y):
-                x = 0
-                while x < dim_x:
-                    run_data = f.read(4)
-                    if len(run_data) < 4:
-                        raise ValueError(f"Unexpected EOF at z={z}, y={y}, x={x}")
-                    
-                    run_length = struct.unpack("<H", run_data[0:2])[0]
-                    value = struct.unpack("<B", run_data[2:3])[0]
-                    _flags = struct.unpack("<B", run_data[3:4])[0]
-                    
-                    if run_length == 0:
-                        raise ValueError(f"Invalid run_length=0 at z={z}, y={y}")
-                    
-                    end_x = min(x + run_length, dim_x)
-                    if value == 1:
-                        grid[x:end_x, y, z] = True
-                    x = end_x
-                
-                if x != dim_x:
-                    raise ValueError(f"Row length mismatch at z={z}, y={y}: got {x}, expected {dim_x}")
+        # View the RLE payload in place as run records (no payload copy)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        n_runs = max(len(mm) - header_size, 0) // RUN_DTYPE.itemsize
+        runs = np.frombuffer(mm, dtype=RUN_DTYPE, count=n_runs, offset=min(header_size, len(mm)))
+        if lazy:
+            grid = RLEGrid(*_run_index(runs, dim_x, dim_y, dim_z), (dim_x, dim_y, dim_z))
+        else:
+            grid = _decode_runs(runs, dim_x, dim_y, dim_z)
+    finally:
+        runs = None
+        try:
+            mm.close()
+        except BufferError:
+            pass  # Still referenced by a raised error's traceback; freed with it
+    
+    return grid, voxel_size, (origin_x, origin_y, origin_z)
+
+
+def _decode_runs(runs: np.ndarray, dim_x: int, dim_y: int, dim_z: int) -> np.ndarray:
+    """
+    Expand RUN_DTYPE records (rows ordered z, then y) into a grid.
+    
+    Records past the last row are ignored.
+    
+    Args:
+        runs: RUN_DTYPE array
+        dim_x, dim_y, dim_z: Grid dimensions
+    
+    Returns:
+        3D boolean array [dim_x, dim_y, dim_z], a transposed view of the
+        [z, y, x] decode buffer (rows stay contiguous along x)
+    
+    Raises:
+        ValueError: If runs are missing, empty, or cross a row boundary
+    """
+    n_voxels = dim_x * dim_y * dim_z
+    if n_voxels == 0:
+        return np.zeros((dim_x, dim_y, dim_z), dtype=bool)
+    
+    if HAS_NUMBA:
+        n_rows = dim_y * dim_z
+        lengths = runs["length"]
+        row_start, status, row, x = _scan_run_rows(lengths, dim_x, n_rows)
+        z, y = row // dim_y, row % dim_y
+        if status == _RUN_EOF:
+            raise ValueError(f"Unexpected EOF at z={z}, y={y}, x={x}")
+        if status == _RUN_ZERO:
+            raise ValueError(f"Invalid run_length=0 at z={z}, y={y}")
+        if status == _RUN_MISMATCH:
+            raise ValueError(f"Row length mismatch at z={z}, y={y}: got {x}, expected {dim_x}")
         
-        return grid, voxel_size, (origin_x, origin_y, origin_z)
+        rows = np.zeros((n_rows, dim_x), dtype=bool)
+        _fill_run_rows(lengths, runs["value"], row_start, rows)
+        return rows.reshape(dim_z, dim_y, dim_x).transpose(2, 1, 0)
+    
+    ends, solid = _run_index(runs, dim_x, dim_y, dim_z)
+    flat = np.repeat(solid, np.diff(ends, prepend=0))
+    return flat.reshape(dim_z, dim_y, dim_x).transpose(2, 1, 0)
+
+
+def _run_index(
+    runs: np.ndarray, dim_x: int, dim_y: int, dim_z: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate RUN_DTYPE records and index them by their end positions.
+    
+    Positions count voxels along the flattened [z, y, x] payload order, so
+    voxel p belongs to run np.searchsorted(ends, p, side="right").
+    
+    Args:
+        runs: RUN_DTYPE array
+        dim_x, dim_y, dim_z: Grid dimensions
+    
+    Returns:
+        Tuple of (ends int64, solid bool) arrays over the runs in use
+    
+    Raises:
+        ValueError: If runs are missing, empty, or cross a row boundary
+    """
+    n_voxels = dim_x * dim_y * dim_z
+    if n_voxels == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    
+    def location(position):
+        row, x = divmod(int(position), dim_x)
+        return row // dim_y, row % dim_y, x
+    
+    lengths = runs["length"].astype(np.int64)
+    ends = np.cumsum(lengths)
+    
+    # Only the runs covering the grid count; EOF if they fall short
+    n_used = int(np.searchsorted(ends, n_voxels)) + 1
+    if n_used > len(runs):
+        z, y, x = location(ends[-1] if len(ends) else 0)
+        raise ValueError(f"Unexpected EOF at z={z}, y={y}, x={x}")
+    lengths = lengths[:n_used]
+    ends = ends[:n_used]
+    
+    zero = np.flatnonzero(lengths == 0)
+    if len(zero):
+        z, y, _ = location(ends[zero[0]])
+        raise ValueError(f"Invalid run_length=0 at z={z}, y={y}")
+    
+    # Every row must end exactly on a run boundary
+    row_ends = np.arange(1, n_voxels // dim_x + 1, dtype=np.int64) * dim_x
+    crossing = np.flatnonzero(ends[np.searchsorted(ends, row_ends)] != row_ends)
+    if len(crossing):
+        row_end = row_ends[crossing[0]]
+        z, y, _ = location(row_end - dim_x)
+        got = ends[np.searchsorted(ends, row_end)] - (row_end - dim_x)
+        raise ValueError(f"Row length mismatch at z={z}, y={y}: got {got}, expected {dim_x}")
+    
+    return ends, runs["value"][:n_used] == 1
 
 
 def _encode_rle_row(row: np.ndarray) -> list:
@@ -204,27 +325,405 @@ def _encode_rle_row(row: np.ndarray) -> list:
     if len(row) == 0:
         return []
     
-    runs = []
-    current_value = int(row[0])
-    run_length = 1
+    lengths, values = _rle_row_runs(row)
+    return list(zip(lengths.tolist(), values.tolist()))
+
+
+def _rle_row_runs(row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run lengths and values of a non-empty 1D boolean array.
+    
+    Args:
+        row: 1D boolean array
+    
+    Returns:
+        Tuple of (lengths, values) arrays
+    """
+    # Run boundaries are where the value changes between neighbors
+    row_u8 = np.ascontiguousarray(row, dtype=bool).view(np.uint8)
+    boundaries = np.flatnonzero(np.diff(row_u8)) + 1
+    boundaries = np.concatenate(([0], boundaries, [len(row_u8)]))
+    
+    return np.diff(boundaries), row_u8[boundaries[:-1]]
+
+
+def _pack_runs(lengths: np.ndarray, values: np.ndarray) -> bytes:
+    """
+    Serialize runs as RUN_DTYPE records, splitting runs over MAX_RUN_LENGTH.
+    
+    Args:
+        lengths: Run lengths
+        values: Run values (0 or 1)
+    
+    Returns:
+        Packed run records
+    """
+    n_chunks = (lengths + (MAX_RUN_LENGTH - 1)) // MAX_RUN_LENGTH
+    if (n_chunks > 1).any():
+        # Every chunk is full length except the last one of each run
+        last = np.cumsum(n_chunks) - 1
+        split = np.full(last[-1] + 1, MAX_RUN_LENGTH, dtype=np.int64)
+        split[last] = lengths - (n_chunks - 1) * MAX_RUN_LENGTH
+        lengths, values = split, np.repeat(values, n_chunks)
+    
+    runs = np.zeros(len(lengths), dtype=RUN_DTYPE)
+    runs["length"] = lengths
+    runs["value"] = values
+    return runs.tobytes()
+
+
+# _scan_run_rows status codes
+_RUN_OK, _RUN_EOF, _RUN_ZERO, _RUN_MISMATCH = range(4)
+
+if HAS_NUMBA:
+    @njit(cache=True, inline="always")
+    def _run_end(flat, words, start, row_end):
+        """
+        End of the run starting at flat[start], scanning at most to row_end.
+        
+        Compares 8 voxels at a time as uint64 words (SWAR): a word equal to
+        the run value broadcast to every byte extends the run by 8, otherwise
+        the lowest differing byte (little-endian) is where the run stops.
+        """
+        value = flat[start]
+        pattern = np.uint64(value) * np.uint64(0x0101010101010101)
+        p = start + 1
+        while p < row_end and p & 7:
+            if flat[p] != value:
+                return p
+            p += 1
+        while p + 8 <= row_end:
+            diff = words[p >> 3] ^ pattern
+            if diff != 0:
+                while not diff & np.uint64(0xFF):
+                    diff >>= np.uint64(8)
+                    p += 1
+                return p
+            p += 8
+        while p < row_end and flat[p] == value:
+            p += 1
+        return p
+    
+    @njit(parallel=True, cache=True)
+    def _encode_run_rows(flat, words, n_rows, dim_x):
+        """
+        Packed RUN_DTYPE bytes for rows of uint8 0/1 voxels.
+        
+        flat holds the rows back to back and words is its uint64 view (the
+        length rounded down to 8 bytes). Runs are counted, then filled into
+        an exact-size buffer, both over prange.
+        """
+        counts = np.zeros(n_rows + 1, dtype=np.int64)
+        for r in prange(n_rows):
+            x, row_end = r * dim_x, (r + 1) * dim_x
+            n = 0
+            while x < row_end:
+                end = _run_end(flat, words, x, row_end)
+                n += (end - x + MAX_RUN_LENGTH - 1) // MAX_RUN_LENGTH
+                x = end
+            counts[r + 1] = n
+        offsets = np.cumsum(counts)
+        
+        out = np.zeros(offsets[-1] * 4, dtype=np.uint8)
+        for r in prange(n_rows):
+            k = offsets[r] * 4
+            x, row_end = r * dim_x, (r + 1) * dim_x
+            while x < row_end:
+                end = _run_end(flat, words, x, row_end)
+                remaining = end - x
+                while remaining > 0:
+                    chunk = min(remaining, MAX_RUN_LENGTH)
+                    out[k] = chunk & 0xFF
+                    out[k + 1] = chunk >> 8
+                    out[k + 2] = flat[x]
+                    k += 4
+                    remaining -= chunk
+                x = end
+        return out
+    
+    @njit(cache=True)
+    def _scan_run_rows(lengths, dim_x, n_rows):
+        """First run of every row, plus (status, row, x) of the first error."""
+        row_start = np.zeros(n_rows + 1, dtype=np.int64)
+        k = 0
+        for r in range(n_rows):
+            row_start[r] = k
+            x = 0
+            while x < dim_x:
+                if k >= len(lengths):
+                    return row_start, _RUN_EOF, r, x
+                if lengths[k] == 0:
+                    return row_start, _RUN_ZERO, r, x
+                x += lengths[k]
+                k += 1
+            if x != dim_x:
+                return row_start, _RUN_MISMATCH, r, x
+        row_start[n_rows] = k
+        return row_start, _RUN_OK, 0, 0
+    
+    @njit(parallel=True, cache=True)
+    def _fill_run_rows(lengths, values, row_start, rows):
+        """Expand each row's runs into rows, rows spread over prange."""
+        for r in prange(rows.shape[0]):
+            x = 0
+            for k in range(row_start[r], row_start[r + 1]):
+                if values[k] == 1:
+                    rows[r, x:x + lengths[k]] = True
+                x += lengths[k]
+
+
+class VoxelGrid:
+    """
+    Bit-packed boolean voxel grid (1 bit per voxel).
+    
+    Bits are packed along the last (z) axis with np.packbits, so data has
+    shape [dim_x, dim_y, ceil(dim_z / 8)] and 8x fewer bytes than a bool
+    array. np.asarray(voxel_grid) unpacks to a dense bool array, so
+    instances can be passed to any function expecting a dense grid.
+    
+    Example:
+        >>> vg = VoxelGrid.empty((100, 30, 100))
+        >>> vg.fill_block((0, 100), (0, 1), (0, 100))  # Floor
+        >>> vg.any_block((10, 20), (1, 18), (10, 20))
+        False
+    """
+    
+    def __init__(self, data: np.ndarray, shape: Tuple[int, int, int]):
+        self.data = data
+        self.shape = tuple(int(d) for d in shape)
     
-    for i in range(1, len(row)):
-        value = int(row[i])
-        if value == current_value:
-            run_length += 1
+    @classmethod
+    def empty(cls, shape: Tuple[int, int, int]) -> "VoxelGrid":
+        """Create an all-empty packed grid."""
+        dim_x, dim_y, dim_z = shape
+        return cls(np.zeros((dim_x, dim_y, (dim_z + 7) // 8), dtype=np.uint8), shape)
+    
+    @classmethod
+    def from_dense(cls, grid: np.ndarray) -> "VoxelGrid":
+        """Pack a dense 3D boolean array."""
+        grid = np.asarray(grid, dtype=bool)
+        if grid.ndim != 3:
+            raise ValueError(f"Grid must be 3D, got shape {grid.shape}")
+        return cls(np.packbits(grid, axis=-1), grid.shape)
+    
+    def to_dense(self) -> np.ndarray:
+        """Unpack to a dense 3D boolean array."""
+        return np.unpackbits(self.data, axis=-1, count=self.shape[2]).view(bool)
+    
+    def __array__(self, dtype=None, copy=None):
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the packed data."""
+        return self.data.nbytes
+    
+    def count(self) -> int:
+        """Number of solid voxels."""
+        return int(_POPCOUNT_TABLE[self.data].sum(dtype=np.int64))
+    
+    def _byte_span(self, z_range: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Byte range and edge masks covering voxels [z0, z1) along z."""
+        z0, z1 = z_range
+        b0, b1 = z0 // 8, (z1 + 7) // 8
+        first_mask = 0xFF >> (z0 % 8)
+        last_mask = (0xFF << (8 * b1 - z1)) & 0xFF
+        return b0, b1, first_mask, last_mask
+    
+    def any_block(
+        self,
+        x_range: Tuple[int, int],
+        y_range: Tuple[int, int],
+        z_range: Tuple[int, int],
+    ) -> bool:
+        """
+        Check whether any voxel in a half-open index box is solid.
+        
+        Ranges are clamped to the grid bounds.
+        """
+        (x0, x1), (y0, y1), (z0, z1) = self._clamp(x_range, y_range, z_range)
+        if x0 >= x1 or y0 >= y1 or z0 >= z1:
+            return False
+        
+        b0, b1, first_mask, last_mask = self._byte_span((z0, z1))
+        block = self.data[x0:x1, y0:y1, b0:b1]
+        
+        # OR-reduce every (x, y) row of the span down to one byte lane per byte
+        lanes = np.bitwise_or.reduce(block.reshape(-1, b1 - b0), axis=0)
+        if b1 - b0 == 1:
+            return bool(lanes[0] & first_mask & last_mask)
+        return bool(
+            (lanes[0] & first_mask)
+            or (lanes[-1] & last_mask)
+            or lanes[1:-1].any()
+        )
+    
+    def fill_block(
+        self,
+        x_range: Tuple[int, int],
+        y_range: Tuple[int, int],
+        z_range: Tuple[int, int],
+        value: bool = True,
+    ) -> None:
+        """Set every voxel in a half-open index box to value (clamped to bounds)."""
+        (x0, x1), (y0, y1), (z0, z1) = self._clamp(x_range, y_range, z_range)
+        if x0 >= x1 or y0 >= y1 or z0 >= z1:
+            return
+        
+        b0, b1, first_mask, last_mask = self._byte_span((z0, z1))
+        masks = np.full(b1 - b0, 0xFF, dtype=np.uint8)
+        masks[0] &= first_mask
+        masks[-1] &= last_mask
+        
+        block = self.data[x0:x1, y0:y1, b0:b1]
+        if value:
+            block |= masks
         else:
-            runs.append((run_length, current_value))
-            current_value = value
-            run_length = 1
+            block &= ~masks
     
-    runs.append((run_length, current_value))
-    return runs
+    def _clamp(self, *ranges):
+        return [
+            (max(0, int(lo)), min(dim, int(hi)))
+            for (lo, hi), dim in zip(ranges, self.shape)
+        ]
+
+
+# Set-bit count for every byte value
+_POPCOUNT_TABLE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+
+class RLEGrid:
+    """
+    Read-only voxel grid answered straight from its RLE runs.
+    
+    Stores where each run ends along the flattened [z, y, x] payload order
+    and whether it is solid, so memory scales with the number of runs, not
+    voxels. Lookups are binary searches over the run ends; np.asarray()
+    expands to a dense bool array. Created by read_rlevox(path, lazy=True).
+    
+    Example:
+        >>> grid, voxel_size, origin = read_rlevox("collision.rlevox", lazy=True)
+        >>> grid[10, 0, 10]
+        True
+    """
+    
+    def __init__(self, ends: np.ndarray, solid: np.ndarray, shape: Tuple[int, int, int]):
+        self.ends = ends
+        self.solid = solid
+        self.shape = tuple(int(d) for d in shape)
+        # Solid runs before each run, for range counts in any_block
+        self._solid_before = np.concatenate(([0], np.cumsum(solid, dtype=np.int64)))
+    
+    def _position(self, x, y, z):
+        dim_x, dim_y, _ = self.shape
+        return (z * dim_y + y) * dim_x + x
+    
+    def __getitem__(self, index) -> bool:
+        x, y, z = (int(i) for i in index)
+        if not all(0 <= i < d for i, d in zip((x, y, z), self.shape)):
+            raise IndexError(f"Voxel index {(x, y, z)} out of bounds for shape {self.shape}")
+        run = int(np.searchsorted(self.ends, self._position(x, y, z), side="right"))
+        return bool(self.solid[run])
+    
+    def to_dense(self) -> np.ndarray:
+        """Expand to a dense 3D boolean array."""
+        dim_x, dim_y, dim_z = self.shape
+        flat = np.repeat(self.solid, np.diff(self.ends, prepend=0))
+        return flat.reshape(dim_z, dim_y, dim_x).transpose(2, 1, 0)
+    
+    def __array__(self, dtype=None, copy=None):
+        dense = self.to_dense()
+        return dense if dtype is None else dense.astype(dtype)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the run index."""
+        return self.ends.nbytes + self.solid.nbytes + self._solid_before.nbytes
+    
+    def count(self) -> int:
+        """Number of solid voxels."""
+        return int(np.diff(self.ends, prepend=0)[self.solid].sum())
+    
+    def any_block(
+        self,
+        x_range: Tuple[int, int],
+        y_range: Tuple[int, int],
+        z_range: Tuple[int, int],
+    ) -> bool:
+        """
+        Check whether any voxel in a half-open index box is solid.
+        
+        Ranges are clamped to the grid bounds. Each (y, z) row of the box
+        costs two binary searches.
+        """
+        (x0, x1), (y0, y1), (z0, z1) = [
+            (max(0, int(lo)), min(dim, int(hi)))
+            for (lo, hi), dim in zip((x_range, y_range, z_range), self.shape)
+        ]
+        if x0 >= x1 or y0 >= y1 or z0 >= z1:
+            return False
+        
+        y, z = np.meshgrid(np.arange(y0, y1), np.arange(z0, z1))
+        first = np.searchsorted(self.ends, self._position(x0, y, z).ravel(), side="right")
+        last = np.searchsorted(self.ends, self._position(x1 - 1, y, z).ravel(), side="right")
+        return bool((self._solid_before[last + 1] > self._solid_before[first]).any())
+
+
+def grids_equal(
+    a: Union[np.ndarray, VoxelGrid, RLEGrid],
+    b: Union[np.ndarray, VoxelGrid, RLEGrid],
+) -> bool:
+    """
+    Check whether two voxel grids hold the same voxels.
+    
+    Grids may be dense arrays, VoxelGrid or RLEGrid in any mix. Two
+    VoxelGrids compare their packed bytes and two RLEGrids the positions
+    where their value changes, without unpacking; dense grids are compared
+    8 bytes at a time when both share a contiguous layout.
+    
+    Args:
+        a, b: 3D voxel grids [x, y, z]
+    
+    Returns:
+        True if the shapes and every voxel match
+    """
+    if tuple(a.shape) != tuple(b.shape):
+        return False
+    
+    if isinstance(a, VoxelGrid) and isinstance(b, VoxelGrid):
+        # Padding bits past dim_z are always zero (packbits, clamped fills)
+        return np.array_equal(a.data, b.data)
+    
+    if isinstance(a, RLEGrid) and isinstance(b, RLEGrid):
+        # Runs split at rows and MAX_RUN_LENGTH differ between encodings;
+        # the first value plus every value change pins down the grid
+        if len(a.solid) == 0 or len(b.solid) == 0:
+            return len(a.solid) == len(b.solid)
+        edges_a = a.ends[:-1][a.solid[1:] != a.solid[:-1]]
+        edges_b = b.ends[:-1][b.solid[1:] != b.solid[:-1]]
+        return bool(a.solid[0] == b.solid[0]) and np.array_equal(edges_a, edges_b)
+    
+    a = np.asarray(a, dtype=bool)
+    b = np.asarray(b, dtype=bool)
+    # read_rlevox grids are transposed views: compare them in memory order
+    for x, y in ((a, b), (a.T, b.T)):
+        if x.flags.c_contiguous and y.flags.c_contiguous:
+            x = x.reshape(-1).view(np.uint8)
+            y = y.reshape(-1).view(np.uint8)
+            n_words = len(x) & ~7
+            return (
+                np.array_equal(x[:n_words].view(np.uint64), y[:n_words].view(np.uint64))
+                and np.array_equal(x[n_words:], y[n_words:])
+            )
+    return np.array_equal(a, b)
 
 
 def grid_to_world(
     indices: np.ndarray,
     voxel_size: float,
     origin: Tuple[float, float, float],
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Convert voxel indices to world coordinates (center of voxel).
@@ -233,18 +732,21 @@ def grid_to_world(
         indices: Nx3 array of [x, y, z] voxel indices
         voxel_size: Size of each voxel
         origin: World origin of voxel [0,0,0]
+        out: Optional Nx3 float array to write the result into
     
     Returns:
         Nx3 array of world coordinates (center of each voxel)
     """
-    origin_arr = np.array(origin)
-    return origin_arr + (indices + 0.5) * voxel_size
+    centers = np.add(indices, 0.5)
+    centers *= voxel_size
+    return np.add(centers, np.asarray(origin, dtype=np.float64), out=out)
 
 
 def world_to_grid(
     positions: np.ndarray,
     voxel_size: float,
     origin: Tuple[float, float, float],
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Convert world coordinates to voxel indices.
@@ -253,12 +755,19 @@ def world_to_grid(
         positions: Nx3 array of world coordinates
         voxel_size: Size of each voxel
         origin: World origin of voxel [0,0,0]
+        out: Optional Nx3 integer array to write the result into
     
     Returns:
         Nx3 array of voxel indices (integers)
     """
-    origin_arr = np.array(origin)
-    return np.floor((positions - origin_arr) / voxel_size).astype(int)
+    # One float temporary, reused in place for the divide and floor
+    scaled = np.subtract(positions, np.asarray(origin, dtype=np.float64))
+    np.divide(scaled, voxel_size, out=scaled)
+    np.floor(scaled, out=scaled)
+    if out is None:
+        return scaled.astype(int)
+    np.copyto(out, scaled, casting="unsafe")
+    return out
 
 
 def check_collision_point(
@@ -280,14 +789,19 @@ def check_collision_point(
         True if point is inside solid voxel
     """
     dim_x, dim_y, dim_z = grid.shape
-    idx = world_to_grid(np.array([position]), voxel_size, origin)[0]
+    
+    # Scalar math: a single point does not pay for array temporaries
+    idx = [
+        math.floor((float(p) - float(o)) / voxel_size)
+        for p, o in zip(position, origin)
+    ]
     
     if (idx[0] < 0 or idx[0] >= dim_x or
         idx[1] < 0 or idx[1] >= dim_y or
         idx[2] < 0 or idx[2] >= dim_z):
         return False
     
-    return grid[idx[0], idx[1], idx[2]]
+    return bool(grid[idx[0], idx[1], idx[2]])
 
 
 def check_collision_capsule(
@@ -304,7 +818,7 @@ def check_collision_capsule(
     Uses AABB approximation for simplicity (capsule bounding box).
     
     Args:
-        grid: 3D boolean voxel grid [x, y, z]
+        grid: 3D boolean voxel grid [x, y, z] (dense, VoxelGrid or RLEGrid)
         position: Player position (feet) as [x, y, z]
         radius: Player capsule radius
         height: Player capsule height
@@ -314,6 +828,13 @@ def check_collision_capsule(
     Returns:
         True if collision detected
     """
+    if HAS_NUMBA and isinstance(grid, np.ndarray) and grid.dtype == np.bool_:
+        px, py, pz = (float(v) for v in position)
+        ox, oy, oz = (float(v) for v in origin)
+        return _capsule_any(
+            grid, px, py, pz, float(radius), float(height), float(voxel_size), ox, oy, oz
+        )
+    
     dim_x, dim_y, dim_z = grid.shape
     origin_arr = np.array(origin)
     
@@ -326,16 +847,32 @@ def check_collision_capsule(
     
     # Clamp to grid bounds
     min_idx = np.maximum(min_idx, 0)
-    max_idx = np.minimum(max_idx, [dim_x, dim_y, dim_z])
+    max_idx = np.clip(max_idx, 0, [dim_x, dim_y, dim_z])
     
     # Check all voxels in bounding box
-    for x in range(min_idx[0], max_idx[0]):
-        for y in range(min_idx[1], max_idx[1]):
-            for z in range(min_idx[2], max_idx[2]):
-                if grid[x, y, z]:
-                    return True
-    
-    return False
+    (x0, y0, z0), (x1, y1, z1) = min_idx.tolist(), max_idx.tolist()
+    if isinstance(grid, (VoxelGrid, RLEGrid)):
+        return grid.any_block((x0, x1), (y0, y1), (z0, z1))
+    return bool(grid[x0:x1, y0:y1, z0:z1].any())
+
+
+if HAS_NUMBA:
+    @njit(cache=True, boundscheck=False)
+    def _capsule_any(grid, px, py, pz, radius, height, voxel_size, ox, oy, oz):
+        """check_collision_capsule's AABB scan, returning on the first solid voxel."""
+        dim_x, dim_y, dim_z = grid.shape
+        x0 = max(int(np.floor((px - radius - ox) / voxel_size)), 0)
+        y0 = max(int(np.floor((py - oy) / voxel_size)), 0)
+        z0 = max(int(np.floor((pz - radius - oz) / voxel_size)), 0)
+        x1 = min(int(np.ceil((px + radius - ox) / voxel_size)), dim_x)
+        y1 = min(int(np.ceil((py + height - oy) / voxel_size)), dim_y)
+        z1 = min(int(np.ceil((pz + radius - oz) / voxel_size)), dim_z)
+        for x in range(x0, x1):
+            for y in range(y0, y1):
+                for z in range(z0, z1):
+                    if grid[x, y, z]:
+                        return True
+        return False
 
 
 def voxelize_points(
@@ -360,10 +897,17 @@ def voxelize_points(
         return np.zeros((1, 1, 1), dtype=bool), (0.0, 0.0, 0.0)
     
     points = np.asarray(points)
+    use_kernel = HAS_NUMBA and points.dtype.kind == "f"
+    if use_kernel:
+        points = np.ascontiguousarray(points)
     
     # Compute bounds
-    min_pt = points.min(axis=0) - padding * voxel_size
-    max_pt = points.max(axis=0) + padding * voxel_size
+    if use_kernel:
+        lo, hi = _point_bounds(points)
+    else:
+        lo, hi = points.min(axis=0), points.max(axis=0)
+    min_pt = lo - padding * voxel_size
+    max_pt = hi + padding * voxel_size
     
     # Compute grid dimensions
     dims = np.ceil((max_pt - min_pt) / voxel_size).astype(int)
@@ -372,16 +916,55 @@ def voxelize_points(
     # Create empty grid
     grid = np.zeros(dims, dtype=bool)
     
-    # Convert points to indices and mark occupied
-    indices = np.floor((points - min_pt) / voxel_size).astype(int)
-    indices = np.clip(indices, 0, dims - 1)
-    
-    grid[indices[:, 0], indices[:, 1], indices[:, 2]] = True
+    if use_kernel:
+        # Fused index + clip + scatter, no per-point temporaries
+        _voxelize_kernel(
+            points,
+            min_pt.astype(points.dtype),
+            points.dtype.type(voxel_size),
+            grid,
+        )
+    else:
+        # Convert points to indices and mark occupied
+        indices = np.floor((points - min_pt) / voxel_size).astype(int)
+        indices = np.clip(indices, 0, dims - 1)
+        
+        # One flat scatter; duplicates just rewrite True, so no np.unique
+        grid.reshape(-1)[np.ravel_multi_index(indices.T, dims)] = True
     
     origin = tuple(min_pt.tolist())
     return grid, origin
 
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _point_bounds(points):
+        """Per-axis min and max of an Nx3 array in a single pass."""
+        lo = points[0].copy()
+        hi = points[0].copy()
+        for n in range(1, points.shape[0]):
+            for a in range(3):
+                v = points[n, a]
+                if v < lo[a]:
+                    lo[a] = v
+                elif v > hi[a]:
+                    hi[a] = v
+        return lo, hi
+    
+    @njit(parallel=True, cache=True)
+    def _voxelize_kernel(points, min_pt, voxel_size, grid):
+        """Mark the voxel of each point; every thread only ever writes True."""
+        dim_x, dim_y, dim_z = grid.shape
+        for n in prange(points.shape[0]):
+            i = int(np.floor((points[n, 0] - min_pt[0]) / voxel_size))
+            j = int(np.floor((points[n, 1] - min_pt[1]) / voxel_size))
+            k = int(np.floor((points[n, 2] - min_pt[2]) / voxel_size))
+            i = min(max(i, 0), dim_x - 1)
+            j = min(max(j, 0), dim_y - 1)
+            k = min(max(k, 0), dim_z - 1)
+            grid[i, j, k] = True
+
+
 def dilate_grid(grid: np.ndarray, iterations: int = 1) -> np.ndarray:
     """
     Dilate a voxel grid (expand solid regions).
@@ -395,6 +978,14 @@ def dilate_grid(grid: np.ndarray, iterations: int = 1) -> np.ndarray:
     """
     from scipy import ndimage
     
+    if iterations > 2:
+        # N 6-connected dilations reach exactly the voxels within taxicab
+        # distance N of a solid one: one distance transform instead of N passes
+        grid = np.asarray(grid, dtype=bool)
+        if not grid.any():
+            return np.zeros_like(grid)
+        return ndimage.distance_transform_cdt(~grid, metric="taxicab") <= iterations
+    
     struct = ndimage.generate_binary_structure(3, 1)  # 6-connectivity
     return ndimage.binary_dilation(grid, structure=struct, iterations=iterations)
 
@@ -448,15 +1039,12 @@ def remove_small_components(
     from scipy import ndimage
     
     labeled, num_features = ndimage.label(grid)
-    component_sizes = ndimage.sum(grid, labeled, range(1, num_features + 1))
-    
-    # Create mask of large enough components
-    large_components = np.zeros_like(grid)
-    for i, size in enumerate(component_sizes, 1):
-        if size >= min_size:
-            large_components |= (labeled == i)
+    component_sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)
     
-    return large_components
+    # Per-label keep table, applied in one gather over the grid
+    keep = component_sizes >= min_size
+    keep[0] = False  # Background
+    return keep[labeled].astype(np.asarray(grid).dtype, copy=False)
 
 
 def get_grid_stats(grid: np.ndarray, voxel_size: float) -> dict:
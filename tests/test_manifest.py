@@ -1,6 +1,7 @@
 """Tests for manifest.py - Manifest and LevelJson dataclasses."""
 
 import json
+import sys
 import pytest
 
 from stella.manifest import (
@@ -73,6 +74,22 @@ class TestManifest:
         assert restored.world.title == original.world.title
         assert restored.generator.name == original.generator.name
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need Python 3.10+")
+    def test_slotted_instances(self):
+        """Test that manifest types reject undeclared attributes."""
+        manifest = make_manifest()
+        assert not hasattr(manifest, "__dict__")
+        with pytest.raises(AttributeError):
+            manifest.undeclared = True
+    
+    def test_created_utc_is_iso(self):
+        """Test the default timestamp parses as a UTC ISO 8601 datetime."""
+        from datetime import datetime, timedelta, timezone
+        
+        created = datetime.fromisoformat(Manifest().created_utc)
+        assert created.utcoffset() == timedelta(0)
+        assert abs(datetime.now(timezone.utc) - created) < timedelta(seconds=5)
+    
     def test_manifest_validation_valid(self):
         """Test validation passes for valid manifest."""
         manifest = Manifest(
@@ -126,6 +143,42 @@ class TestLevelJson:
         assert parsed["spawn"]["position"] == [5.0, 1.7, 10.0]
         assert parsed["spawn"]["yaw_degrees"] == 90.0
     
+    @pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+    def test_numpy_values_serialize(self, monkeypatch, backend):
+        """Test every JSON backend accepts NumPy scalars and arrays."""
+        import numpy as np
+        import stella.manifest as manifest_module
+        
+        if backend != "json":
+            pytest.importorskip(backend)
+        monkeypatch.setattr(manifest_module, "HAS_ORJSON", backend == "orjson")
+        monkeypatch.setattr(manifest_module, "HAS_MSGSPEC", backend == "msgspec")
+        
+        level = LevelJson(
+            spawn=Spawn(position=[np.float64(1.5), np.float32(0.25), np.int64(2)], yaw_degrees=np.float64(90.0)),
+        )
+        parsed = json.loads(level.to_json_bytes())
+        assert parsed["spawn"]["position"] == [1.5, 0.25, 2]
+        assert parsed["spawn"]["yaw_degrees"] == 90.0
+        
+        assert json.loads(manifest_module.json_dumps_bytes({"a": np.arange(3)[::2]})) == {"a": [0, 2]}
+        with pytest.raises(TypeError):
+            manifest_module.json_dumps_bytes({"a": object()})
+    
+    @pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+    def test_malformed_json_raises_decode_error(self, monkeypatch, backend):
+        """Test every JSON backend reports malformed input as json.JSONDecodeError."""
+        import stella.manifest as manifest_module
+        
+        if backend != "json":
+            pytest.importorskip(backend)
+        monkeypatch.setattr(manifest_module, "HAS_ORJSON", backend == "orjson")
+        monkeypatch.setattr(manifest_module, "HAS_MSGSPEC", backend == "msgspec")
+        
+        for data in (b"{not json", '{"a": 1', memoryview(b'{"\xc3\xa9": x}')):
+            with pytest.raises(json.JSONDecodeError):
+                manifest_module.json_loads(data)
+    
     def test_level_from_json(self):
         """Test level JSON deserialization."""
         json_str = '''
@@ -165,6 +218,33 @@ class TestLevelJson:
         assert restored.name == original.name
         assert restored.spawn.position == original.spawn.position
         assert restored.collision.player.height_m == 1.9
+    
+    def test_render_extensions(self):
+        """Test render extensions are omitted by default and roundtrip when set."""
+        level = LevelJson()
+        assert "extensions" not in level.to_dict()["render"]
+        
+        level.render.extensions = ["EXT_meshopt_compression"]
+        restored = LevelJson.from_json(level.to_json())
+        assert restored.render.extensions == ["EXT_meshopt_compression"]
+    
+    def test_none_fields_omitted(self):
+        """Test that unset optional fields are left out rather than null."""
+        from stella.manifest import CaptureInfo
+        
+        manifest = Manifest(
+            levels=[Level(id="0", path="levels/0/level.json")],
+            generator=Generator(),
+        )
+        d = manifest.to_dict()
+        assert d["levels"] == [{"id": "0", "path": "levels/0/level.json"}]
+        assert "git_commit" not in d["generator"]
+        
+        level = LevelJson(capture=CaptureInfo(source="floorplan"))
+        d = level.to_dict()
+        assert d["navigation"] == {"type": "none"}
+        assert d["capture"] == {"source": "floorplan"}
+        assert None not in json.loads(level.to_json())["navigation"].values()
 
 
 class TestMakeManifest:
@@ -231,5 +311,27 @@ class TestMakeLevelJson:
         assert level.render.uri == "custom_render.glb"
 
 
+class TestJsonBackend:
+    """Test the JSON backend helpers."""
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_roundtrip_with_backend(self, use_orjson, monkeypatch):
+        """Test manifest roundtrip with and without orjson."""
+        from stella import manifest as manifest_module
+        
+        if use_orjson and not manifest_module.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(manifest_module, "HAS_ORJSON", use_orjson)
+        if not use_orjson:
+            monkeypatch.setattr(manifest_module, "HAS_MSGSPEC", False)
+        
+        original = make_manifest(title="Backend Test", tags=["x"])
+        json_str = original.to_json()
+        
+        assert json.loads(json_str) == original.to_dict()
+        assert Manifest.from_json(json_str.encode("utf-8")).world.title == "Backend Test"
+        assert Manifest.from_json(memoryview(json_str.encode("utf-8"))).world.title == "Backend Test"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -6,7 +6,8 @@ import pytest
 
 from stella.package import (
     pack_stella, unpack_stella, get_stella_info,
-    verify_stella_checksums, read_stella_file, compute_sha256,
+    verify_stella_checksums, read_stella_file, read_stella_files, compute_sha256,
+    load_manifest, clear_manifest_cache, get_level_json, StellaReader,
 )
 from stella.manifest import make_manifest, make_level_json
 
@@ -92,6 +93,66 @@ class TestPackStella:
         finally:
             os.unlink(path)
     
+    def test_checksum_errors_in_order(self):
+        """Test that parallel verification reports errors in line order."""
+        import zipfile
+        
+        file_map = {f"levels/{i}/level.json": b"{}" for i in range(8)}
+        good = compute_sha256(b"{}")
+        lines = [f"{good}  levels/{i}/level.json" for i in range(8)]
+        lines[2] = f"{'0' * 64}  levels/2/level.json"
+        lines[5] = f"{good}  levels/5/missing.json"
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), file_map, include_checksums=False)
+            with zipfile.ZipFile(path, "a") as zf:
+                zf.writestr("checksums.sha256", "\r\n".join(lines + ["", "bogus"]))
+            
+            valid, errors = verify_stella_checksums(path, max_workers=4)
+            assert not valid
+            assert errors == [
+                "Checksum mismatch for levels/2/level.json",
+                "Missing file: levels/5/missing.json",
+                "Malformed checksum line: bogus",
+            ]
+    
+    def test_empty_member_checksums(self):
+        """Test empty members verify against the empty digest, in line order."""
+        import zipfile
+        from stella.package import EMPTY_SHA256
+        
+        file_map = {"a.bin": b"", "b.bin": b"data", "c.bin": b"", "d.bin": b""}
+        lines = [
+            f"{EMPTY_SHA256}  a.bin",
+            f"{compute_sha256(b'data')}  b.bin",
+            f"{'0' * 64}  c.bin",
+            f"{EMPTY_SHA256}  d.bin",
+        ]
+        assert compute_sha256(b"") == EMPTY_SHA256
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), file_map)
+            assert verify_stella_checksums(path)[0]
+            
+            pack_stella(path, make_manifest(), file_map, include_checksums=False)
+            with zipfile.ZipFile(path, "a") as zf:
+                zf.writestr("checksums.sha256", "\n".join(lines))
+            assert verify_stella_checksums(path) == (False, ["Checksum mismatch for c.bin"])
+    
+    def test_sha256_preferred_over_blake3(self):
+        """Test checksums.sha256 is used when both checksums files exist."""
+        import zipfile
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), {"levels/0/level.json": b"{}"})
+            with zipfile.ZipFile(path, "a") as zf:
+                zf.writestr("checksums.blake3", f"{'0' * 64}  levels/0/level.json")
+            
+            assert verify_stella_checksums(path) == (True, [])
+    
     def test_no_checksums(self):
         """Test packing without checksums."""
         manifest = make_manifest(title="No Checksum Test")
@@ -105,10 +166,84 @@ class TestPackStella:
             
             valid, errors = verify_stella_checksums(path)
             assert valid  # Should pass (no checksums to verify)
-            assert "No checksums" in errors[0]
+            assert errors == ["No checksums.sha256 file found (not an error)"]
+        finally:
+            os.unlink(path)
+
+    def test_pack_from_pairs(self):
+        """Test packing from (path, source) pairs; later duplicates win."""
+        import zipfile
+        
+        entries = [
+            ("levels/0/render.glb", b"old"),
+            ("levels/0/level.json", b"{}"),
+            ("levels/0/render.glb", b"new"),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), entries)
+            
+            with zipfile.ZipFile(path) as zf:
+                assert zf.namelist() == [
+                    "manifest.json",
+                    "levels/0/level.json",
+                    "levels/0/render.glb",
+                    "checksums.sha256",
+                ]
+                assert zf.read("levels/0/render.glb") == b"new"
+            assert verify_stella_checksums(path)[0]
+    
+    def test_compression_by_suffix(self):
+        """Test that pre-compressed assets are stored and the rest deflated."""
+        import zipfile
+        
+        manifest = make_manifest(title="Compression Test", thumbnail="thumbs/cover.png")
+        file_map = {
+            "levels/0/level.json": b"{}",
+            "levels/0/render.glb": b"glb " * 100,
+            "thumbs/cover.png": b"png " * 100,
+        }
+        
+        with tempfile.NamedTemporaryFile(suffix='.stella', delete=False) as f:
+            path = f.name
+        
+        try:
+            pack_stella(path, manifest, file_map)
+            
+            with zipfile.ZipFile(path) as zf:
+                assert zf.getinfo("thumbs/cover.png").compress_type == zipfile.ZIP_STORED
+                assert zf.getinfo("levels/0/render.glb").compress_type == zipfile.ZIP_DEFLATED
+                assert zf.getinfo("manifest.json").compress_type == zipfile.ZIP_DEFLATED
+                assert zf.read("thumbs/cover.png") == file_map["thumbs/cover.png"]
         finally:
             os.unlink(path)
 
+    def test_streamed_sources(self):
+        """Test packing entries from a Path and from a stream callable."""
+        import io
+        from pathlib import Path
+        
+        manifest = make_manifest(title="Streaming Test")
+        glb_data = os.urandom(3 << 20)
+        vox_data = b"vox " * 1000
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            glb_path = Path(tmpdir) / "render.glb"
+            glb_path.write_bytes(glb_data)
+            file_map = {
+                "levels/0/level.json": b"{}",
+                "levels/0/render.glb": glb_path,
+                "levels/0/collision.rlevox": lambda: io.BytesIO(vox_data),
+            }
+            
+            path = Path(tmpdir) / "test.stella"
+            pack_stella(path, manifest, file_map)
+            
+            assert read_stella_file(path, "levels/0/render.glb") == glb_data
+            assert read_stella_file(path, "levels/0/collision.rlevox") == vox_data
+            valid, errors = verify_stella_checksums(path)
+            assert valid, errors
+
 
 class TestUnpackStella:
     """Test .stella unpacking."""
@@ -182,6 +317,50 @@ class TestGetStellaInfo:
             assert info["archive_size"] > 0
         finally:
             os.unlink(path)
+    
+    def test_get_info_cache_invalidation(self):
+        """Test that cached info is refreshed when the archive changes."""
+        file_map = {"levels/0/level.json": b"{}"}
+        
+        with tempfile.NamedTemporaryFile(suffix='.stella', delete=False) as f:
+            path = f.name
+        
+        try:
+            pack_stella(path, make_manifest(title="First"), file_map)
+            info = get_stella_info(path)
+            assert info["manifest"]["world"]["title"] == "First"
+            
+            # Mutating the returned dict must not leak into the cache
+            info["manifest"]["world"]["title"] = "Mutated"
+            assert get_stella_info(path)["manifest"]["world"]["title"] == "First"
+            
+            pack_stella(path, make_manifest(title="Second, longer title"), file_map)
+            info = get_stella_info(path)
+            assert info["manifest"]["world"]["title"] == "Second, longer title"
+        finally:
+            os.unlink(path)
+
+    def test_load_manifest_cache(self):
+        """Test that cached manifests are copied and refreshed on change."""
+        from stella.package import _load_manifest_cached
+        
+        file_map = {"levels/0/level.json": b"{}"}
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            clear_manifest_cache()
+            pack_stella(path, make_manifest(title="First"), file_map)
+            
+            manifest = load_manifest(path)
+            manifest.world.title = "Mutated"
+            assert load_manifest(path).world.title == "First"
+            assert _load_manifest_cached.cache_info().hits == 1
+            
+            pack_stella(path, make_manifest(title="Second, longer title"), file_map)
+            assert load_manifest(path).world.title == "Second, longer title"
+            
+            clear_manifest_cache()
+            assert _load_manifest_cached.cache_info().currsize == 0
 
 
 class TestReadStellaFile:
@@ -206,6 +385,108 @@ class TestReadStellaFile:
         finally:
             os.unlink(path)
 
+    def test_read_many_files(self):
+        """Test bulk reads return members in the requested order."""
+        file_map = {
+            "levels/0/level.json": b"{}",
+            "levels/0/render.glb": b"glb",
+            "levels/0/collision.rlevox": b"vox",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), file_map)
+            
+            names = ["levels/0/render.glb", "levels/0/collision.rlevox", "levels/0/level.json"]
+            contents = read_stella_files(path, names)
+            assert list(contents) == names
+            assert contents == file_map
+            with pytest.raises(KeyError):
+                read_stella_files(path, ["levels/0/render.glb", "missing"])
+
+    def test_concurrent_reads_across_archives(self):
+        """Test threaded reads over many archives return the right bytes."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, f"{i}.stella") for i in range(40)]
+            for i, path in enumerate(paths):
+                pack_stella(path, make_manifest(), {"levels/0/render.glb": b"glb %d" % i})
+            
+            jobs = [i % len(paths) for i in range(400)]
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                contents = list(ex.map(
+                    lambda i: read_stella_file(paths[i], "levels/0/render.glb"), jobs
+                ))
+            assert contents == [b"glb %d" % i for i in jobs]
+            
+            # Nothing keeps the archives open afterwards
+            for path in paths:
+                os.unlink(path)
+    
+    def test_level_json_after_rewrite(self):
+        """Test that level reads see a rewritten archive."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            level = make_level_json(name="First")
+            pack_stella(path, make_manifest(), {"levels/0/level.json": level.to_json_bytes()})
+            assert get_level_json(path).name == "First"
+            
+            level = make_level_json(name="Second, longer name")
+            pack_stella(path, make_manifest(), {"levels/0/level.json": level.to_json_bytes()})
+            assert get_level_json(path).name == "Second, longer name"
+            with pytest.raises(ValueError):
+                get_level_json(path, level_id="1")
+
+    def test_stella_reader(self):
+        """Test reading members and level data through one reader."""
+        file_map = {
+            "levels/0/level.json": make_level_json(name="Reader").to_json_bytes(),
+            "levels/0/render.glb": b"glb",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(title="Reader Test"), file_map)
+            
+            with StellaReader(path) as reader:
+                assert "levels/0/render.glb" in reader
+                assert reader.read("levels/0/render.glb") == b"glb"
+                with reader.open("levels/0/render.glb") as fh:
+                    assert fh.read() == b"glb"
+                assert reader.manifest().world.title == "Reader Test"
+                assert reader.level_json("0").name == "Reader"
+
+    @pytest.mark.parametrize("use_isal", [False, True])
+    def test_stella_reader_inflate(self, monkeypatch, use_isal):
+        """Test the direct read path matches zipfile and checks the CRC."""
+        import zipfile
+        import stella.package as package
+        if use_isal:
+            pytest.importorskip("isal")
+        monkeypatch.setattr(package, "HAS_ISAL", use_isal)
+        
+        data = b"deflate me " * 5000
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), {"levels/0/render.glb": data, "thumb.png": data})
+            
+            with StellaReader(path) as reader:
+                assert reader.read("levels/0/render.glb") == data
+                assert reader.read("thumb.png") == data
+                with pytest.raises(KeyError):
+                    reader.read("levels/0/missing.glb")
+            
+            with zipfile.ZipFile(path) as zf:
+                info = zf.getinfo("levels/0/render.glb")
+                assert info.compress_type == zipfile.ZIP_DEFLATED
+            with StellaReader(path) as reader:
+                reader._zf.getinfo("levels/0/render.glb").CRC ^= 1
+                with pytest.raises(zipfile.BadZipFile):
+                    reader.read("levels/0/render.glb")
+            
+            reader.close()
+            with pytest.raises(ValueError, match="closed"):
+                reader.read("thumb.png")
+
 
 class TestComputeSha256:
     """Test SHA256 computation."""
@@ -220,6 +501,29 @@ class TestComputeSha256:
         hello_hash = compute_sha256(b"hello")
         assert hello_hash == "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
 
+    def test_unknown_algorithm(self):
+        """Test that an unknown checksum algorithm is rejected before writing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            with pytest.raises(ValueError):
+                pack_stella(path, make_manifest(), {}, checksum_algorithm="md5")
+            assert not os.path.exists(path)
+
+    def test_blake3_roundtrip(self):
+        """Test packing and verifying with BLAKE3 checksums."""
+        pytest.importorskip("blake3")
+        import zipfile
+        
+        file_map = {"levels/0/level.json": b"{}", "levels/0/render.glb": b"glb"}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test.stella")
+            pack_stella(path, make_manifest(), file_map, checksum_algorithm="blake3")
+            
+            with zipfile.ZipFile(path) as zf:
+                assert zf.namelist()[-1] == "checksums.blake3"
+            valid, errors = verify_stella_checksums(path)
+            assert valid, errors
+
 
 class TestValidateStella:
     """Test .stella validation."""
@@ -271,6 +575,24 @@ class TestValidateStella:
         finally:
             os.unlink(path)
     
+    def test_validate_bad_manifest(self):
+        """Test validation reports unparseable and level-less manifests."""
+        import zipfile
+        from stella.package import validate_stella
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bad.stella")
+            with zipfile.ZipFile(path, "w") as zf:
+                zf.writestr("manifest.json", b"{not json")
+            valid, errors = validate_stella(path)
+            assert not valid
+            assert errors[0].startswith("Invalid JSON in manifest.json")
+            
+            with zipfile.ZipFile(path, "w") as zf:
+                zf.writestr("manifest.json", b'{"format": "stella.world"}')
+            valid, errors = validate_stella(path)
+            assert errors == ["Manifest must contain at least one level"]
+    
     def test_validate_nonexistent_file(self):
         """Test validation of non-existent file."""
         from stella.package import validate_stella
@@ -280,5 +602,25 @@ class TestValidateStella:
         assert any("not found" in e.lower() for e in errors)
 
 
+class TestPackageExports:
+    """Test lazy top-level exports."""
+    
+    def test_lazy_exports_resolve(self):
+        """Test that every name in stella.__all__ resolves to its submodule object."""
+        import stella
+        from stella import package
+        
+        for name in stella.__all__:
+            assert getattr(stella, name) is not None
+        assert stella.pack_stella is package.pack_stella
+    
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        import stella
+        
+        with pytest.raises(AttributeError):
+            stella.does_not_exist
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
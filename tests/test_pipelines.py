@@ -1,5 +1,6 @@
 """Tests for pipeline modules."""
 
+import json
 import os
 import tempfile
 import numpy as np
@@ -30,6 +31,76 @@ class TestFloorplanPipeline:
         assert len(mesh.vertices) > 0
         assert len(mesh.faces) > 0
     
+    def test_wall_mesh_merges_runs(self):
+        """Test that a straight wall run becomes a single box."""
+        occupancy = np.zeros((20, 20), dtype=bool)
+        occupancy[5, 2:18] = True
+        
+        mesh = create_wall_mesh_from_2d(occupancy, wall_height=2.7, voxel_size=0.1)
+        
+        assert len(mesh.faces) == 10 + 2  # 4 sides + top, no bottom; floor
+        box = mesh.vertices[mesh.faces[:10].ravel()]
+        np.testing.assert_allclose(box.min(axis=0), [0.5, 0.0, 0.2])
+        np.testing.assert_allclose(box.max(axis=0), [0.6, 2.7, 1.8])
+    
+    def test_wall_mesh_exposed_faces(self):
+        """Test wall surfaces enclose the wall volume and face outward."""
+        rng = np.random.default_rng(3)
+        occupancy = rng.random((20, 15)) < 0.5
+        voxel_size, wall_height = 0.1, 2.7
+        
+        mesh = create_wall_mesh_from_2d(occupancy, wall_height, voxel_size)
+        
+        expected = occupancy.sum() * voxel_size ** 2 * wall_height
+        assert mesh.volume == pytest.approx(expected, rel=1e-4)
+        
+        # Just outside each wall face there must be no wall
+        probe = mesh.triangles_center + mesh.face_normals * 1e-3
+        probe = probe[probe[:, 1] > 2e-3]  # Skip the floor
+        ix = np.floor(probe[:, [0, 2]] / voxel_size).astype(int)
+        inside = (ix >= 0).all(axis=1) & (ix < occupancy.shape).all(axis=1)
+        inside &= probe[:, 1] < wall_height
+        inside[inside] = occupancy[ix[inside, 0], ix[inside, 1]]
+        assert not inside.any()
+    
+    def test_greedy_rectangles_cover(self):
+        """Test that greedy rectangles cover every set pixel exactly once."""
+        from stella.geometry import greedy_rectangles
+        
+        rng = np.random.default_rng(7)
+        mask = rng.random((30, 25)) < 0.6
+        cover = np.zeros(mask.shape, dtype=int)
+        for u0, v0, du, dv in greedy_rectangles(mask):
+            cover[u0:u0 + du, v0:v0 + dv] += 1
+        np.testing.assert_array_equal(cover, mask)
+    
+    def test_greedy_rectangles_kernel_matches_python(self, monkeypatch):
+        """Test the Numba scan returns the same rectangles as the Python one."""
+        import stella.geometry as geometry
+        if not geometry.HAS_NUMBA:
+            pytest.skip("numba required")
+        
+        rng = np.random.default_rng(3)
+        mask = rng.random((40, 35)) < 0.5
+        mask[5:20, 10:30] = True
+        
+        rects = geometry.greedy_rectangles(mask)
+        monkeypatch.setattr(geometry, "HAS_NUMBA", False)
+        assert rects == geometry.greedy_rectangles(mask)
+    
+    def test_wall_mesh_single_pixel(self):
+        """Test that a single wall pixel becomes one box above the floor."""
+        occupancy = np.zeros((4, 3), dtype=bool)
+        occupancy[2, 1] = True
+        
+        mesh = create_wall_mesh_from_2d(occupancy, wall_height=2.5, voxel_size=0.5)
+        
+        assert len(mesh.faces) == 10 + 2
+        box = mesh.vertices[mesh.faces[:10].ravel()]
+        np.testing.assert_allclose(box.min(axis=0), [1.0, 0.0, 0.5])
+        np.testing.assert_allclose(box.max(axis=0), [1.5, 2.5, 1.0])
+        np.testing.assert_allclose(mesh.bounds[1], [2.0, 2.5, 1.5])
+    
     def test_build_floorplan_simple(self):
         """Test building .stella from a simple floorplan image."""
         # Create a test image
@@ -71,6 +142,37 @@ class TestFloorplanPipeline:
             )
 
 
+class TestCompressGlb:
+    """Test optional GLB post-processing."""
+    
+    def test_compress_none_passes_through(self, tmp_path):
+        """Test that 'none' returns the input GLB without writing a copy."""
+        from stella.glb import compress_glb
+        
+        src = tmp_path / "in.glb"
+        src.write_bytes(b"glb bytes")
+        dst = tmp_path / "out.glb"
+        
+        assert compress_glb(src, dst, "none") == (src, [])
+        assert not dst.exists()
+    
+    def test_compress_unknown_method(self, tmp_path):
+        """Test that unknown methods are rejected."""
+        from stella.glb import compress_glb
+        
+        with pytest.raises(ValueError, match="Unknown GLB compression"):
+            compress_glb(tmp_path / "in.glb", tmp_path / "out.glb", "draco")
+    
+    def test_compress_meshopt_requires_gltfpack(self, tmp_path, monkeypatch):
+        """Test that meshopt fails clearly when gltfpack is missing."""
+        from stella import glb
+        
+        monkeypatch.setattr(glb.shutil, "which", lambda name: None)
+        
+        with pytest.raises(FileNotFoundError, match="gltfpack"):
+            glb.compress_glb(tmp_path / "in.glb", tmp_path / "out.glb", "meshopt")
+
+
 class TestGeometry:
     """Test geometry utilities."""
     
@@ -94,6 +196,7 @@ class TestGeometry:
             all_points,
             n_iterations=500,
             distance_threshold=0.05,
+            rng=np.random.default_rng(42),
         )
         
         # Normal should point roughly up
@@ -102,6 +205,146 @@ class TestGeometry:
         # Most floor points should be inliers
         assert inliers[:n_points].sum() > n_points * 0.9
     
+    def test_ransac_required_iterations(self):
+        """Test the adaptive RANSAC iteration bound."""
+        from stella.geometry import _ransac_required_iterations
+        
+        assert _ransac_required_iterations(0.0, 0.99) == np.inf
+        assert _ransac_required_iterations(1.0, 0.99) == 1.0
+        # 50% inliers -> 1/8 chance per triple -> ~35 samples for 99%
+        assert _ransac_required_iterations(0.5, 0.99) == pytest.approx(34.5, abs=0.1)
+    
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_count_inliers_matches_numpy(self, use_numba, monkeypatch):
+        """Test the inlier counting kernel against a direct NumPy evaluation."""
+        from stella import geometry
+        
+        if use_numba and not geometry.HAS_NUMBA:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(geometry, "HAS_NUMBA", use_numba)
+        
+        rng = np.random.default_rng(0)
+        points = rng.random((500, 3))
+        normals = rng.normal(size=(20, 3))
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        offsets = rng.normal(size=20) * 0.1
+        
+        expected = (np.abs(points @ normals.T + offsets) < 0.05).sum(axis=0)
+        counts = geometry._count_inliers(points, normals, offsets, 0.05)
+        single = geometry._count_inliers(points, normals, offsets, 0.05, n_threads=1)
+        
+        np.testing.assert_array_equal(counts, expected)
+        np.testing.assert_array_equal(single, expected)
+    
+    def test_voxel_grid_to_mesh(self):
+        """Test naive voxel meshing emits one box per solid voxel."""
+        from stella.geometry import voxel_grid_to_mesh, create_box_mesh
+        
+        grid = np.zeros((4, 3, 2), dtype=bool)
+        grid[1, 2, 0] = True
+        grid[3, 0, 1] = True
+        
+        vertices, faces = voxel_grid_to_mesh(grid, voxel_size=0.5, origin=(1.0, 0.0, -1.0))
+        
+        assert vertices.shape == (16, 3)
+        assert faces.shape == (24, 3)
+        
+        box_verts, box_faces = create_box_mesh(
+            np.array([2.5, 0.0, -0.5]), np.array([3.0, 0.5, 0.0])
+        )
+        np.testing.assert_allclose(vertices[8:], box_verts)
+        np.testing.assert_array_equal(faces[12:], box_faces + 8)
+        assert faces.dtype == np.int32
+        
+        _, empty_faces = voxel_grid_to_mesh(np.zeros((2, 2, 2), dtype=bool), 0.5, (0.0, 0.0, 0.0))
+        assert empty_faces.shape == (0, 3) and empty_faces.dtype == np.int32
+    
+    def test_greedy_mesh_solid_box(self):
+        """Test greedy meshing collapses a solid box to 6 quads."""
+        from stella.geometry import greedy_mesh_voxels
+        
+        grid = np.zeros((6, 5, 7), dtype=bool)
+        grid[1:5, 1:4, 1:6] = True
+        
+        vertices, faces = greedy_mesh_voxels(grid, voxel_size=0.5, origin=(1.0, 2.0, 3.0))
+        
+        assert faces.shape == (12, 3)
+        assert faces.dtype == np.int32
+        assert greedy_mesh_voxels(np.zeros((2, 2, 2), dtype=bool), 0.5, (0.0, 0.0, 0.0))[1].dtype == np.int32
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+        mesh.merge_vertices()
+        assert mesh.is_watertight
+        assert mesh.volume == pytest.approx(4 * 3 * 5 * 0.125)
+        np.testing.assert_allclose(mesh.bounds, [[1.5, 2.5, 3.5], [3.5, 4.0, 6.0]])
+    
+    def test_greedy_mesh_random_volume(self):
+        """Test greedy meshing preserves enclosed volume with outward normals."""
+        from stella.geometry import greedy_mesh_voxels
+        
+        grid = np.random.default_rng(1).random((8, 8, 8)) > 0.5
+        
+        vertices, faces = greedy_mesh_voxels(grid, voxel_size=1.0, origin=(0.0, 0.0, 0.0))
+        
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        assert mesh.volume == pytest.approx(grid.sum())
+    
+    def test_compute_spawn_position(self):
+        """Test spawn search finds the first clear, grounded column."""
+        from stella.geometry import compute_spawn_position
+        
+        grid = np.zeros((16, 25, 12), dtype=bool)
+        grid[:, 0, :] = True  # Floor slab
+        grid[:6, :, :] = True  # Solid block filling the low-x half
+        
+        spawn = compute_spawn_position(grid, voxel_size=0.1, origin=(0.0, 0.0, 0.0))
+        
+        # First free x with a 3-voxel radius clearance is 6 + 3 = 9
+        np.testing.assert_allclose(spawn, [0.95, 0.1, 0.35])
+        
+        # Packed input gives the same answer
+        from stella.vox_rle import VoxelGrid
+        packed_spawn = compute_spawn_position(
+            VoxelGrid.from_dense(grid), voxel_size=0.1, origin=(0.0, 0.0, 0.0)
+        )
+        np.testing.assert_allclose(packed_spawn, spawn)
+    
+    def test_compute_spawn_position_no_room(self):
+        """Test spawn search returns None when the grid is too small."""
+        from stella.geometry import compute_spawn_position
+        
+        grid = np.zeros((4, 10, 4), dtype=bool)
+        
+        assert compute_spawn_position(grid, voxel_size=0.1, origin=(0.0, 0.0, 0.0)) is None
+    
+    def test_points_in_polygon(self):
+        """Test batch point-in-polygon against the scalar version."""
+        from stella.geometry import points_in_polygon, is_point_in_polygon
+        
+        # L-shaped room
+        polygon = [(0, 0), (4, 0), (4, 2), (2, 2), (2, 4), (0, 4)]
+        points = np.array([
+            [1.0, 1.0],  # inside
+            [3.0, 1.0],  # inside
+            [3.0, 3.0],  # in the notch
+            [1.0, 3.0],  # inside
+            [5.0, 1.0],  # outside
+            [-1.0, -1.0],  # outside
+        ])
+        
+        inside = points_in_polygon(points, polygon)
+        
+        np.testing.assert_array_equal(inside, [True, True, False, True, False, False])
+        assert [is_point_in_polygon(tuple(p), polygon) for p in points] == inside.tolist()
+    
+    def test_rotation_matrix_from_axis_angle(self):
+        """Test axis-angle rotation against a known 90 degree rotation."""
+        from stella.geometry import rotation_matrix_from_axis_angle
+        
+        R = rotation_matrix_from_axis_angle(np.array([0.0, 0.0, 1.0]), np.pi / 2)
+        
+        np.testing.assert_allclose(R, [[0, -1, 0], [1, 0, 0], [0, 0, 1]], atol=1e-6)
+        np.testing.assert_allclose(R @ R.T, np.eye(3), atol=1e-6)
+    
     def test_align_to_gravity(self):
         """Test gravity alignment."""
         # Create points with tilted floor
@@ -123,6 +366,21 @@ class TestGeometry:
         # The y-spread should be reduced
         assert R.shape == (3, 3)
 
+    def test_transform_points(self):
+        """Test batch transform matches per-point homogeneous transform."""
+        from stella.geometry import transform_points, transform_point
+        
+        T = np.eye(4)
+        T[:3, :3] = [[0, -1, 0], [1, 0, 0], [0, 0, 1]]  # 90 degrees about Z
+        T[:3, 3] = [1.0, 2.0, 3.0]
+        points = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [2.0, 3.0, 4.0]])
+        
+        transformed = transform_points(points, T)
+        
+        expected = np.array([(T @ np.append(p, 1))[:3] for p in points])
+        np.testing.assert_allclose(transformed, expected)
+        np.testing.assert_allclose(transform_point(points[2], T), expected[2])
+
 
 class TestEmpty:
     """Placeholder tests for video pipeline (requires MASt3R-SLAM)."""
@@ -135,6 +393,84 @@ class TestEmpty:
         
         assert callable(build_video)
         assert callable(load_point_cloud)
+    
+    def test_render_mesh_from_points(self):
+        """Test one colored point per input point, exported as GLB POINTS."""
+        from stella.pipeline_video import create_render_mesh_from_points
+        
+        points = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])
+        colors = np.array([[1.0, 0.0, 0.5], [10, 20, 30]])
+        
+        cloud = create_render_mesh_from_points(points, colors)
+        
+        np.testing.assert_allclose(cloud.vertices, points)
+        np.testing.assert_array_equal(cloud.colors[0], [255, 0, 127, 255])
+        np.testing.assert_array_equal(cloud.colors[1], [10, 20, 30, 255])
+        
+        gltf = trimesh.exchange.gltf.export_glb(trimesh.Scene(cloud))
+        header_len = int.from_bytes(gltf[12:16], "little")
+        doc = json.loads(gltf[20:20 + header_len])
+        assert [p["mode"] for p in doc["meshes"][0]["primitives"]] == [0]
+    
+    def test_render_mesh_from_no_points(self):
+        """Test an empty point cloud still exports as a GLB."""
+        from stella.pipeline_video import create_render_mesh_from_points
+        
+        mesh = create_render_mesh_from_points(np.zeros((0, 3)), np.zeros((0, 3)))
+        
+        glb = mesh.export(file_type="glb")
+        assert glb[:4] == b"glTF"
+    
+    def test_load_point_cloud_binary_ply(self):
+        """Test the numpy PLY reader matches trimesh on a colored cloud."""
+        from stella.pipeline_video import load_point_cloud, _read_binary_ply_points
+        
+        rng = np.random.default_rng(0)
+        points = rng.random((100, 3)).astype(np.float32)
+        colors = rng.integers(0, 256, (100, 4), dtype=np.uint8)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cloud.ply")
+            trimesh.PointCloud(points, colors=colors).export(path)
+            
+            assert _read_binary_ply_points(path) is not None
+            loaded_points, loaded_colors = load_point_cloud(path)
+            expected = trimesh.load(path)
+        
+        np.testing.assert_array_equal(loaded_points, expected.vertices)
+        np.testing.assert_array_equal(loaded_colors, expected.colors[:, :3])
+    
+    def test_clean_occupancy_grid(self):
+        """Test that small components are dropped and large ones kept."""
+        pytest.importorskip("scipy")
+        from stella.pipeline_video import clean_occupancy_grid
+        
+        grid = np.zeros((30, 30, 30), dtype=bool)
+        grid[2:12, 2:12, 2:12] = True  # 1000 voxels
+        grid[20, 20, 20] = True  # Isolated noise
+        grid[25:27, 25:27, 25] = True  # 4 voxels, below the 10 voxel minimum
+        
+        cleaned = clean_occupancy_grid(grid)
+        
+        assert cleaned.dtype == bool
+        assert cleaned.sum() == 1000
+        assert cleaned[2:12, 2:12, 2:12].all()
+    
+    def test_clean_occupancy_grid_2d(self):
+        """Test the 2D path matches scipy's 4-connected labeling."""
+        ndimage = pytest.importorskip("scipy.ndimage")
+        from stella.pipeline_video import clean_occupancy_grid
+        
+        rng = np.random.default_rng(0)
+        grid = rng.random((64, 64)) < 0.3
+        grid[5:25, 5:25] = True
+        
+        labeled, num = ndimage.label(grid)
+        sizes = np.bincount(labeled.ravel())
+        keep = sizes >= max(10, grid.sum() * 0.001)
+        keep[0] = False
+        
+        np.testing.assert_array_equal(clean_occupancy_grid(grid), keep[labeled])
 
 
 if __name__ == "__main__":
@@ -1,11 +1,15 @@
 """Tests for vox_rle.py - RLEVOX format read/write."""
 
+import io
 import numpy as np
 import os
 import tempfile
 import pytest
 
-from stella.vox_rle import write_rlevox, read_rlevox, voxelize_points, grid_to_world, world_to_grid
+from stella.vox_rle import (
+    write_rlevox, read_rlevox, voxelize_points, grid_to_world, world_to_grid, VoxelGrid,
+    RLEGrid, grids_equal,
+)
 
 
 class TestRLEVOXReadWrite:
@@ -31,6 +35,28 @@ class TestRLEVOXReadWrite:
         finally:
             os.unlink(path)
     
+    def test_write_to_file_object(self):
+        """Test that writing to a file object gives the same bytes as a path."""
+        grid = np.zeros((10, 6, 8), dtype=bool)
+        grid[1:9, 0:2, 3:7] = True
+        
+        with tempfile.NamedTemporaryFile(suffix='.rlevox', delete=False) as f:
+            path = f.name
+        
+        try:
+            write_rlevox(path, grid, 0.1, (1.0, 0.0, -2.0))
+            with open(path, "rb") as f:
+                expected = f.read()
+        finally:
+            os.unlink(path)
+        
+        buf = io.BytesIO(b"prefix")
+        buf.seek(0, io.SEEK_END)
+        n_bytes = write_rlevox(buf, grid, 0.1, (1.0, 0.0, -2.0))
+        
+        assert buf.getvalue() == b"prefix" + expected
+        assert n_bytes == len(expected)
+    
     def test_empty_grid(self):
         """Test with completely empty grid."""
         voxel_size = 0.1
@@ -111,6 +137,39 @@ class TestRLEVOXReadWrite:
             assert np.array_equal(grid, read_grid)
         finally:
             os.unlink(path)
+    
+    def test_kernels_match_numpy(self, monkeypatch):
+        """Test the Numba encoder/decoder against the NumPy paths, with split runs."""
+        import stella.vox_rle as vox_rle
+        if not vox_rle.HAS_NUMBA:
+            pytest.skip("numba required")
+        
+        rng = np.random.default_rng(0)
+        grid = rng.random((70000, 2, 3)) < 0.9999
+        
+        buf = io.BytesIO()
+        write_rlevox(buf, grid, 0.1, (0, 0, 0))
+        runs = np.frombuffer(buf.getvalue(), dtype=vox_rle.RUN_DTYPE, offset=64)
+        decoded = vox_rle._decode_runs(runs, *grid.shape)
+        
+        monkeypatch.setattr(vox_rle, "HAS_NUMBA", False)
+        expected_buf = io.BytesIO()
+        write_rlevox(expected_buf, grid, 0.1, (0, 0, 0))
+        
+        assert buf.getvalue() == expected_buf.getvalue()
+        np.testing.assert_array_equal(decoded, vox_rle._decode_runs(runs, *grid.shape))
+        np.testing.assert_array_equal(decoded, grid)
+    
+    def test_encode_rle_row(self):
+        """Test run boundaries, including rows starting solid and strided rows."""
+        from stella.vox_rle import _encode_rle_row
+        
+        row = np.array([1, 1, 0, 0, 0, 1, 0, 1, 1], dtype=bool)
+        
+        assert _encode_rle_row(row) == [(2, 1), (3, 0), (1, 1), (1, 0), (2, 1)]
+        assert _encode_rle_row(row[::2]) == [(1, 1), (3, 0), (1, 1)]
+        assert _encode_rle_row(np.zeros(4, dtype=bool)) == [(4, 0)]
+        assert _encode_rle_row(np.zeros(0, dtype=bool)) == []
 
 
 class TestVoxelizePoints:
@@ -129,6 +188,22 @@ class TestVoxelizePoints:
         assert grid.ndim == 3
         assert grid.sum() == 3  # 3 points = 3 occupied voxels
     
+    def test_kernel_matches_numpy(self, monkeypatch):
+        """Test the Numba kernel marks the same voxels as the NumPy path."""
+        import stella.vox_rle as vox_rle
+        if not vox_rle.HAS_NUMBA:
+            pytest.skip("numba required")
+        
+        rng = np.random.default_rng(0)
+        points = (rng.random((5000, 3)) * 4 - 1).astype(np.float32)
+        
+        grid, origin = voxelize_points(points, voxel_size=0.1, padding=2)
+        monkeypatch.setattr(vox_rle, "HAS_NUMBA", False)
+        expected, expected_origin = voxelize_points(points, voxel_size=0.1, padding=2)
+        
+        np.testing.assert_array_equal(grid, expected)
+        assert origin == expected_origin
+    
     def test_empty_points(self):
         """Test voxelizing empty point array."""
         points = np.array([]).reshape(0, 3)
@@ -179,6 +254,218 @@ class TestCoordinateConversion:
         back_to_grid = world_to_grid(world, voxel_size, origin)
         
         np.testing.assert_array_equal(original_indices, back_to_grid)
+    
+    def test_conversion_into_out(self):
+        """Test that out= buffers receive the same results."""
+        indices = np.array([[5, 10, 15], [0, 0, 0]])
+        world_out = np.empty((2, 3))
+        grid_out = np.empty((2, 3), dtype=np.int32)
+        
+        world = grid_to_world(indices, 0.2, (1.0, 2.0, 3.0), out=world_out)
+        back = world_to_grid(world, 0.2, (1.0, 2.0, 3.0), out=grid_out)
+        
+        assert world is world_out and back is grid_out
+        np.testing.assert_array_equal(back, indices)
+
+
+class TestVoxelGrid:
+    """Test bit-packed voxel grid."""
+    
+    def test_pack_unpack_roundtrip(self):
+        """Test packing preserves the grid and uses 1 bit per voxel."""
+        np.random.seed(0)
+        grid = np.random.choice([True, False], size=(7, 5, 13))
+        
+        vg = VoxelGrid.from_dense(grid)
+        
+        assert vg.shape == grid.shape
+        assert vg.nbytes == 7 * 5 * 2
+        assert vg.count() == grid.sum()
+        assert np.array_equal(np.asarray(vg), grid)
+    
+    def test_any_and_fill_block(self):
+        """Test box queries and fills across byte boundaries."""
+        vg = VoxelGrid.empty((4, 4, 20))
+        vg.fill_block((1, 3), (0, 2), (5, 17))
+        
+        expected = np.zeros((4, 4, 20), dtype=bool)
+        expected[1:3, 0:2, 5:17] = True
+        assert np.array_equal(vg.to_dense(), expected)
+        
+        assert vg.any_block((0, 4), (0, 4), (16, 20))
+        assert not vg.any_block((0, 4), (0, 4), (17, 20))
+        assert not vg.any_block((0, 1), (0, 4), (0, 20))
+        assert vg.any_block((-5, 50), (-5, 50), (-5, 50))
+        
+        vg.fill_block((0, 4), (0, 4), (0, 10), value=False)
+        expected[:, :, 0:10] = False
+        assert np.array_equal(vg.to_dense(), expected)
+    
+    def test_packed_floor_ceiling(self):
+        """Test the packed floor/ceiling builder matches the dense one."""
+        from stella.geometry import create_floor_ceiling_grid
+        
+        dense = create_floor_ceiling_grid((10, 12), ceiling_height=8)
+        packed = create_floor_ceiling_grid((10, 12), ceiling_height=8, packed=True)
+        
+        assert isinstance(packed, VoxelGrid)
+        assert np.array_equal(packed.to_dense(), dense)
+
+
+class TestRLEGrid:
+    """Test lazy grids answered from the RLE runs."""
+    
+    def test_lazy_read_matches_dense(self):
+        """Test point and box queries agree with the decoded array."""
+        rng = np.random.default_rng(3)
+        grid = rng.random((9, 7, 5)) < 0.2
+        grid[:, :, 0] = True
+        
+        with tempfile.NamedTemporaryFile(suffix='.rlevox', delete=False) as f:
+            path = f.name
+        try:
+            write_rlevox(path, grid, 0.1, (0.0, 0.0, 0.0))
+            lazy, voxel_size, _ = read_rlevox(path, lazy=True)
+        finally:
+            os.unlink(path)
+        
+        assert isinstance(lazy, RLEGrid)
+        assert lazy.shape == grid.shape
+        assert np.array_equal(np.asarray(lazy), grid)
+        assert lazy.count() == grid.sum()
+        assert all(lazy[i, j, k] == grid[i, j, k] for i, j, k in np.ndindex(grid.shape))
+        
+        for _ in range(100):
+            lo = rng.integers(-2, 9, size=3)
+            hi = lo + rng.integers(0, 4, size=3)
+            box = tuple(zip(lo, hi))
+            x0, y0, z0 = np.maximum(lo, 0)
+            x1, y1, z1 = np.maximum(hi, 0)
+            assert lazy.any_block(*box) == grid[x0:x1, y0:y1, z0:z1].any()
+        
+        with pytest.raises(IndexError):
+            lazy[9, 0, 0]
+    
+    def test_lazy_collision(self):
+        """Test collision checks accept an RLEGrid."""
+        from stella.vox_rle import check_collision_capsule, check_collision_point
+        
+        grid = np.zeros((20, 20, 20), dtype=bool)
+        grid[10, :, :] = True
+        ends = np.cumsum(np.tile([10, 1, 9], 400))
+        solid = np.tile([False, True, False], 400)
+        lazy = RLEGrid(ends, solid, grid.shape)
+        assert np.array_equal(lazy.to_dense(), grid)
+        
+        assert check_collision_point(lazy, (1.05, 0.5, 0.5), 0.1, (0.0, 0.0, 0.0))
+        assert not check_collision_point(lazy, (0.5, 0.5, 0.5), 0.1, (0.0, 0.0, 0.0))
+        assert check_collision_capsule(lazy, (0.9, 0.5, 0.5), 0.2, 1.0, 0.1, (0.0, 0.0, 0.0))
+        assert not check_collision_capsule(lazy, (0.5, 0.5, 0.5), 0.2, 1.0, 0.1, (0.0, 0.0, 0.0))
+
+
+class TestGridsEqual:
+    """Test voxel grid comparison across representations."""
+    
+    def test_grids_equal(self):
+        """Test dense, packed and RLE grids compare by voxels."""
+        rng = np.random.default_rng(5)
+        grid = rng.random((13, 6, 11)) < 0.3
+        other = grid.copy()
+        other[12, 5, 10] ^= True
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def roundtrip(g, name):
+                path = os.path.join(tmpdir, name)
+                write_rlevox(path, g, 0.1, (0.0, 0.0, 0.0))
+                return read_rlevox(path)[0], read_rlevox(path, lazy=True)[0]
+            
+            dense, lazy = roundtrip(grid, "a.rlevox")
+            other_dense, other_lazy = roundtrip(other, "b.rlevox")
+        
+        same = [grid, dense, lazy, VoxelGrid.from_dense(grid), np.asfortranarray(grid)]
+        different = [other, other_dense, other_lazy, VoxelGrid.from_dense(other)]
+        for x in same:
+            for y in same:
+                assert grids_equal(x, y)
+            for y in different:
+                assert not grids_equal(x, y)
+                assert not grids_equal(y, x)
+        
+        assert not grids_equal(grid, grid[:, :, :10])
+        
+        # Same voxels, runs split differently
+        split = RLEGrid(np.array([2, 4, 6]), np.array([True, True, False]), (6, 1, 1))
+        merged = RLEGrid(np.array([4, 6]), np.array([True, False]), (6, 1, 1))
+        assert grids_equal(split, merged)
+
+
+class TestMorphology:
+    """Test grid cleanup helpers."""
+    
+    def test_remove_small_components(self):
+        """Test that components below min_size are dropped."""
+        pytest.importorskip("scipy")
+        from stella.vox_rle import remove_small_components
+        
+        grid = np.zeros((12, 12, 12), dtype=bool)
+        grid[1:4, 1:4, 1:4] = True  # 27 voxels
+        grid[8:10, 8, 8] = True  # 2 voxels
+        grid[6, 6, 6:11] = True  # 5 voxels
+        
+        cleaned = remove_small_components(grid, min_size=5)
+        
+        expected = grid.copy()
+        expected[8:10, 8, 8] = False
+        assert cleaned.dtype == bool
+        np.testing.assert_array_equal(cleaned, expected)
+
+
+    def test_dilate_grid_many_iterations(self):
+        """Test the distance-transform path against repeated scipy dilation."""
+        ndimage = pytest.importorskip("scipy.ndimage")
+        from stella.vox_rle import dilate_grid
+        
+        rng = np.random.default_rng(0)
+        grid = rng.random((20, 15, 20)) < 0.01
+        struct = ndimage.generate_binary_structure(3, 1)
+        
+        expected = ndimage.binary_dilation(grid, structure=struct, iterations=4)
+        np.testing.assert_array_equal(dilate_grid(grid, iterations=4), expected)
+        assert not dilate_grid(np.zeros((4, 4, 4), dtype=bool), iterations=4).any()
+
+
+class TestCollision:
+    """Test point and capsule collision queries."""
+    
+    def test_capsule_hits_wall(self):
+        """Test the capsule AABB against a wall, dense and bit-packed."""
+        from stella.vox_rle import check_collision_capsule
+        
+        grid = np.zeros((20, 20, 20), dtype=bool)
+        grid[10, :, :] = True  # Wall at x in [1.0, 1.1)
+        
+        for g in (grid, VoxelGrid.from_dense(grid)):
+            assert check_collision_capsule(g, np.array([0.95, 0.0, 1.0]), 0.1, 1.8, 0.1, (0, 0, 0))
+            assert not check_collision_capsule(g, np.array([0.5, 0.0, 1.0]), 0.3, 1.8, 0.1, (0, 0, 0))
+            assert not check_collision_capsule(g, np.array([-5.0, 0.0, 1.0]), 0.3, 1.8, 0.1, (0, 0, 0))
+            assert not check_collision_capsule(g, np.array([-0.5, 0.0, 1.0]), 0.3, 1.8, 0.1, (0, 0, 0))
+    
+    def test_capsule_kernel_matches_numpy(self, monkeypatch):
+        """Test the Numba capsule scan agrees with the NumPy slice test."""
+        import stella.vox_rle as vox_rle
+        if not vox_rle.HAS_NUMBA:
+            pytest.skip("numba required")
+        
+        rng = np.random.default_rng(0)
+        grid = rng.random((30, 15, 30)) < 0.002
+        queries = [(rng.random(3) * 4 - 0.5, rng.random() * 0.5, rng.random() * 2) for _ in range(200)]
+        
+        hits = [vox_rle.check_collision_capsule(grid, p, r, h, 0.1, (0.1, -0.2, 0.3)) for p, r, h in queries]
+        monkeypatch.setattr(vox_rle, "HAS_NUMBA", False)
+        expected = [vox_rle.check_collision_capsule(grid, p, r, h, 0.1, (0.1, -0.2, 0.3)) for p, r, h in queries]
+        
+        assert hits == expected
+        assert any(hits) and not all(hits)
 
 
 class TestInvalidInput:
@@ -196,6 +483,39 @@ class TestInvalidInput:
         finally:
             os.unlink(path)
     
+    def test_truncated_payload(self):
+        """Test reading a file whose runs stop before the last row."""
+        grid = np.zeros((4, 3, 2), dtype=bool)
+        grid[1, :, 1] = True
+        buf = io.BytesIO()
+        write_rlevox(buf, grid, 0.1, (0, 0, 0))
+        
+        with tempfile.NamedTemporaryFile(suffix='.rlevox', delete=False) as f:
+            f.write(buf.getvalue()[:-4])
+            path = f.name
+        
+        try:
+            with pytest.raises(ValueError, match="Unexpected EOF at z=1, y=2"):
+                read_rlevox(path)
+        finally:
+            os.unlink(path)
+    
+    def test_run_crossing_row(self):
+        """Test that a run spilling into the next row is rejected."""
+        buf = io.BytesIO()
+        write_rlevox(buf, np.zeros((4, 2, 1), dtype=bool), 0.1, (0, 0, 0))
+        
+        with tempfile.NamedTemporaryFile(suffix='.rlevox', delete=False) as f:
+            f.write(buf.getvalue()[:64])
+            f.write(bytes([3, 0, 0, 0, 5, 0, 0, 0]))  # 3 + 5 voxels over two rows of 4
+            path = f.name
+        
+        try:
+            with pytest.raises(ValueError, match="Row length mismatch at z=0, y=0: got 8"):
+                read_rlevox(path)
+        finally:
+            os.unlink(path)
+    
     def test_non_3d_grid(self):
         """Test writing non-3D array."""
         grid_2d = np.zeros((10, 10), dtype=bool)